@@ -0,0 +1,305 @@
+"""
+Command-line entry point for Honda Vehicle API
+
+Generates the analysis report offline, without running the web server:
+
+    python -m app.cli report --window 2015-2025 --window 2020-2023
+
+and imports vPIC database exports for the local data source:
+
+    python -m app.cli import-vpic vpic_models.csv
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.analytics import compute_discontinued, compute_statistics, compute_statistics_sweep, slice_years
+from app.services.data_sources import VPICLocalSource
+from app.services.honda_service import HondaModelsService, normalize_make
+
+DEFAULT_WINDOWS = ["2015-2025", "2020-2023"]
+
+def parse_window(value: str) -> Tuple[int, int]:
+    """Parse a START-END year window argument"""
+    try:
+        start_text, end_text = value.split("-", 1)
+        start_year, end_year = int(start_text), int(end_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid window '{value}', expected START-END (e.g. 2015-2025)")
+
+    if start_year > end_year:
+        raise argparse.ArgumentTypeError(f"Invalid window '{value}': start year must be less than or equal to end year")
+    if start_year < settings.MIN_YEAR or end_year > settings.MAX_YEAR:
+        raise argparse.ArgumentTypeError(
+            f"Invalid window '{value}': years must be between {settings.MIN_YEAR} and {settings.MAX_YEAR}"
+        )
+    return start_year, end_year
+
+def parse_make(value: str) -> str:
+    """Validate a --make argument the same way the HTTP routes do"""
+    try:
+        return normalize_make(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def build_windows(args: argparse.Namespace) -> List[Tuple[int, int]]:
+    """Collect explicit and sliding windows, dropping duplicates while keeping order"""
+    if not args.window and not args.span:
+        return [parse_window(value) for value in DEFAULT_WINDOWS]
+
+    windows = list(args.window or [])
+
+    if args.span:
+        span_start, span_end = args.span
+        for start_year in range(span_start, span_end - args.window_length + 2):
+            windows.append((start_year, start_year + args.window_length - 1))
+
+    return list(dict.fromkeys(windows))
+
+def load_yearly_models(path: str) -> Dict[int, Set[str]]:
+    """Load yearly model data from a previously written JSON report"""
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    return {int(year): set(models) for year, models in data["yearly_models"].items()}
+
+def collect_yearly_models(
+    service: HondaModelsService,
+    years: List[int],
+    preloaded: Dict[int, Set[str]],
+    offline: bool
+) -> Dict[int, Set[str]]:
+    """Use preloaded years where available and fetch the remaining ones in parallel"""
+    yearly_models = {year: preloaded[year] for year in years if year in preloaded}
+    missing = [year for year in years if year not in yearly_models]
+
+    if missing and offline:
+        raise ValueError(f"Years missing from input data: {', '.join(map(str, missing))}")
+
+    # Fetch contiguous blocks so the service can parallelize each one
+    block: List[int] = []
+    for year in missing + [None]:
+        if block and (year is None or year != block[-1] + 1):
+            yearly_models.update(service.get_all_models_in_range(block[0], block[-1]))
+            block = []
+        if year is not None:
+            block.append(year)
+
+    return dict(sorted(yearly_models.items()))
+
+DATA_SOURCE_LABELS = {
+    "nhtsa": "NHTSA Vehicle Database",
+    "vpic_local": "NHTSA vPIC database (local import)"
+}
+
+def build_report(
+    make: str,
+    yearly_models: Dict[int, Set[str]],
+    windows: List[Tuple[int, int]],
+    data_source: str = "nhtsa",
+    sweep: Optional[Tuple[int, int, int]] = None
+) -> Dict:
+    """
+    Compute statistics and discontinuation for every window in a single pass
+
+    Args:
+        make (str): Vehicle make the data belongs to
+        yearly_models (Dict[int, Set[str]]): Models keyed by year, covering all windows
+        windows (List[Tuple[int, int]]): Inclusive (start_year, end_year) windows
+        data_source (str): Name of the data source the years came from
+        sweep (Optional[Tuple[int, int, int]]): (span_start, span_end, window_length) of
+            the sliding windows, whose statistics are computed in one incremental pass
+
+    Returns:
+        Dict: JSON-serializable report
+    """
+    sweep_statistics = {}
+    if sweep is not None:
+        span_start, span_end, window_length = sweep
+        for statistics in compute_statistics_sweep(yearly_models, span_start, span_end, window_length):
+            sweep_statistics[statistics["analysis_period"]] = statistics
+
+    window_results = []
+    for start_year, end_year in windows:
+        window_models = slice_years(yearly_models, start_year, end_year)
+        discontinued = compute_discontinued(window_models, start_year, end_year)
+        discontinued_list = sorted(discontinued["discontinued_models"])
+        statistics = sweep_statistics.get(f"{start_year}-{end_year}")
+        if statistics is None:
+            statistics = compute_statistics(window_models, start_year, end_year, discontinued)
+
+        window_results.append({
+            "start_year": start_year,
+            "end_year": end_year,
+            "statistics": statistics,
+            "discontinued": {
+                "early_years_models_count": len(discontinued["early_years_models"]),
+                "recent_years_models_count": len(discontinued["recent_years_models"]),
+                "discontinued_models": discontinued_list,
+                "discontinued_count": len(discontinued_list)
+            }
+        })
+
+    return {
+        "make": make,
+        "generated_at": datetime.now().isoformat(),
+        "data_source": DATA_SOURCE_LABELS.get(data_source, data_source),
+        "windows": window_results,
+        "yearly_models": {year: sorted(models) for year, models in yearly_models.items()}
+    }
+
+def render_markdown(report: Dict) -> str:
+    """Render a report produced by build_report as Markdown"""
+    make = report["make"].title()
+    lines = [
+        f"# {make} Vehicle Models Analysis",
+        "",
+        f"_Generated {report['generated_at']} from the {report['data_source']}._",
+        "",
+        "## 📊 Summary",
+        "",
+        "| Period | Unique Models | Peak Year | Lowest Year | Avg / Year | Discontinued |",
+        "|--------|---------------|-----------|-------------|------------|--------------|"
+    ]
+
+    for window in report["windows"]:
+        stats = window["statistics"]
+        lines.append(
+            f"| {stats['analysis_period']} "
+            f"| {stats['total_unique_models']} "
+            f"| {stats['peak_year']['year']} ({stats['peak_year']['model_count']}) "
+            f"| {stats['lowest_year']['year']} ({stats['lowest_year']['model_count']}) "
+            f"| {stats['average_models_per_year']} "
+            f"| {window['discontinued']['discontinued_count']} |"
+        )
+
+    for window in report["windows"]:
+        stats = window["statistics"]
+        discontinued = window["discontinued"]
+        lines += [
+            "",
+            f"## 🔍 {stats['analysis_period']}",
+            "",
+            f"- **Definition**: Models sold at least once from {window['start_year']}-{window['end_year'] - 2} "
+            f"but NOT sold in {window['end_year'] - 1}-{window['end_year']}",
+            f"- **Total Models Analyzed**: {stats['total_unique_models']}",
+            f"- **Discontinued Models Found**: {discontinued['discontinued_count']}",
+            f"- **Growth Years**: {', '.join(map(str, stats['trend_analysis']['growth_years'])) or 'none'}",
+            f"- **Decline Years**: {', '.join(map(str, stats['trend_analysis']['decline_years'])) or 'none'}",
+            "",
+            "| Year | Models |",
+            "|------|--------|"
+        ]
+        lines += [f"| {year} | {count} |" for year, count in stats["yearly_model_counts"].items()]
+
+        if discontinued["discontinued_models"]:
+            lines += ["", "**Discontinued models:**", ""]
+            lines += [f"- {model}" for model in discontinued["discontinued_models"]]
+
+    return "\n".join(lines) + "\n"
+
+def write_file(path: str, content: str) -> None:
+    """Write text content, creating parent directories as needed"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(content)
+
+def run_report(args: argparse.Namespace) -> int:
+    """Handle the `report` command"""
+    windows = build_windows(args)
+    years = sorted({year for start_year, end_year in windows for year in range(start_year, end_year + 1)})
+
+    service = HondaModelsService(make=args.make)
+    if args.workers:
+        service.max_workers = args.workers
+
+    try:
+        preloaded = load_yearly_models(args.input) if args.input else {}
+        yearly_models = collect_yearly_models(service, years, preloaded, args.offline)
+    except HTTPException as e:
+        print(f"❌ Failed to fetch data: {e.detail}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Failed to load data: {e}", file=sys.stderr)
+        return 1
+
+    sweep = (*args.span, args.window_length) if args.span else None
+    report = build_report(service.make, yearly_models, windows, service.source.name, sweep)
+
+    output = args.output or os.path.join("reports", f"{service.make}_report.md")
+    json_output = args.json or os.path.splitext(output)[0] + ".json"
+    write_file(output, render_markdown(report))
+    write_file(json_output, json.dumps(report, indent=2) + "\n")
+
+    print(f"✅ Analyzed {len(windows)} windows over {len(years)} years")
+    print(f"📄 Report written to {output}")
+    print(f"📊 JSON written to {json_output}")
+    return 0
+
+def run_import_vpic(args: argparse.Namespace) -> int:
+    """Handle the `import-vpic` command"""
+    source = VPICLocalSource(args.db)
+    try:
+        count = source.import_dump(args.dump, replace=not args.append)
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to import {args.dump}: {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ Imported {count} rows into {args.db}")
+    print("Set DATA_SOURCE=vpic_local to serve queries from the local store")
+    return 0
+
+def create_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=settings.PROJECT_DESCRIPTION)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report = subparsers.add_parser("report", help="Generate the Markdown and JSON analysis report")
+    report.add_argument("--make", type=parse_make, default=settings.MAKE, help="Vehicle make to analyze (default: %(default)s)")
+    report.add_argument(
+        "--window", type=parse_window, action="append",
+        help=f"Analysis window START-END, may be repeated (default: {' '.join(DEFAULT_WINDOWS)})"
+    )
+    report.add_argument("--span", type=parse_window, help="Generate sliding windows across START-END")
+    report.add_argument("--window-length", type=int, default=11, help="Length of sliding windows in years (default: %(default)s)")
+    report.add_argument("--input", help="JSON report to load yearly data from instead of fetching it")
+    report.add_argument("--offline", action="store_true", help="Fail instead of fetching years missing from --input")
+    report.add_argument("--workers", type=int, help=f"Parallel upstream requests (default: {settings.MAX_WORKERS})")
+    report.add_argument("--output", help="Markdown report path (default: reports/<make>_report.md)")
+    report.add_argument("--json", help="JSON report path (default: Markdown path with .json extension)")
+    report.set_defaults(handler=run_report)
+
+    import_vpic = subparsers.add_parser("import-vpic", help="Import a vPIC database export into the local data store")
+    import_vpic.add_argument("dump", help="CSV, JSON or JSON lines export with make, model and model year columns (.gz ok)")
+    import_vpic.add_argument("--db", default=settings.VPIC_DB_PATH, help="SQLite store path (default: %(default)s)")
+    import_vpic.add_argument("--append", action="store_true", help="Keep existing rows instead of replacing them")
+    import_vpic.set_defaults(handler=run_import_vpic)
+
+    return parser
+
+def main(argv: List[str] = None) -> int:
+    """Run the command-line interface"""
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    if getattr(args, "window_length", 1) < 1:
+        parser.error("--window-length must be at least 1")
+    if getattr(args, "span", None):
+        span_start, span_end = args.span
+        if span_end - span_start + 1 < args.window_length:
+            parser.error(
+                f"--span {span_start}-{span_end} is shorter than --window-length {args.window_length}"
+            )
+
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
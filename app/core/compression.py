@@ -0,0 +1,229 @@
+# Response compression middleware
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+from app.core.config import settings
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into encoding -> quality
+
+    Args:
+        header (str): Raw Accept-Encoding header value
+
+    Returns:
+        Dict[str, float]: Quality value per encoding (lowercase)
+    """
+    encodings = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[token] = quality
+    return encodings
+
+def select_encoding(header: str) -> Optional[str]:
+    """
+    Pick the best supported encoding for an Accept-Encoding header
+
+    Brotli is preferred over gzip when both are equally acceptable.
+
+    Returns:
+        Optional[str]: "br", "gzip" or None if neither is acceptable
+    """
+    accepted = parse_accept_encoding(header)
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    best, best_quality = None, 0.0
+    for encoding in supported:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given content encoding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_COMPRESSION_LEVEL, mtime=0)
+
+class CompressedBodyCache:
+    """
+    Thread-safe LRU cache of compressed response bodies
+
+    Entries are keyed by encoding and a digest of the uncompressed body, so a
+    stale entry can never be served for changed data.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, body: bytes, encoding: str) -> bytes:
+        """Return the cached compressed body, compressing and storing it on a miss"""
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        compressed = compress(body, encoding)
+        if len(compressed) > self.max_bytes:
+            return compressed
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = compressed
+                self.current_bytes += len(compressed)
+                while self.current_bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.current_bytes -= len(evicted)
+        return compressed
+
+    def clear(self) -> None:
+        """Drop every cached body"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+class CompressionMiddleware:
+    """
+    ASGI middleware negotiating brotli/gzip compression
+
+    Responses below the minimum size, already-encoded responses and streamed
+    responses pass through untouched. Successful GET responses are compressed
+    once and served from the body cache afterwards.
+    """
+
+    def __init__(self, app, minimum_size: int, cache: CompressedBodyCache):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = select_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.cache, scope["method"])
+        await self.app(scope, receive, responder)
+
+class _CompressionResponder:
+    """Buffers a single response and compresses it when worthwhile"""
+
+    def __init__(self, send, encoding: str, minimum_size: int, cache: CompressedBodyCache, method: str):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.cache = cache
+        self.method = method
+        self.start_message = None
+        self.chunks: List[bytes] = []
+        self.passthrough = False
+
+    async def __call__(self, message):
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            response_headers = dict(message.get("headers") or [])
+            if (
+                b"content-encoding" in response_headers
+                or response_headers.get(b"content-type", b"").startswith(b"text/event-stream")
+            ):
+                await self._flush_passthrough()
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            # Multi-part bodies are streamed; don't hold them back
+            await self._flush_passthrough(more_body=True)
+            return
+
+        await self._send_buffered(b"".join(self.chunks))
+
+    async def _flush_passthrough(self, more_body: bool = False):
+        self.passthrough = True
+        await self.send(self.start_message)
+        if self.chunks:
+            await self.send({"type": "http.response.body", "body": b"".join(self.chunks), "more_body": more_body})
+            self.chunks = []
+
+    async def _send_buffered(self, body: bytes):
+        message = self.start_message
+        if len(body) < self.minimum_size:
+            await self.send(message)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        response_headers = [
+            (name, value) for name, value in message.get("headers", [])
+            if name.lower() not in (b"content-length", b"vary")
+        ]
+        vary = [value for name, value in message.get("headers", []) if name.lower() == b"vary"]
+        cache_control = b",".join(value for name, value in message.get("headers", []) if name.lower() == b"cache-control")
+
+        cacheable = (
+            self.method in ("GET", "HEAD")
+            and message["status"] == 200
+            and b"no-store" not in cache_control.lower()
+        )
+        compressed = self.cache.get_or_compress(body, self.encoding) if cacheable else compress(body, self.encoding)
+
+        vary_value = b", ".join(vary + [b"Accept-Encoding"])
+        response_headers += [
+            (b"content-encoding", self.encoding.encode("latin-1")),
+            (b"content-length", str(len(compressed)).encode("latin-1")),
+            (b"vary", vary_value)
+        ]
+        await self.send({**message, "headers": response_headers})
+        await self.send({"type": "http.response.body", "body": compressed})
+
+# Shared cache so other components can inspect or clear it
+response_cache = CompressedBodyCache(settings.COMPRESSION_CACHE_MAX_BYTES)
@@ -1,3 +1,4 @@
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -17,16 +18,68 @@ class Settings(BaseSettings):
     # CORS settings
     ALLOWED_HOSTS: List[str] = ["*"]
     
+    # Admin API settings (the /admin endpoints are disabled while the key is empty)
+    ADMIN_API_KEY: str = ""
+    
+    # Compression settings
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    COMPRESSION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    GZIP_COMPRESSION_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5
+    
+    # Change subscription settings (Server-Sent Events)
+    REFRESH_INTERVAL_SECONDS: float = 60
+    SSE_HEARTBEAT_SECONDS: float = 15
+    SSE_QUEUE_SIZE: int = 100
+    MAX_SUBSCRIPTION_YEARS: int = 10
+    
+    # Event loop watchdog settings
+    LOOP_WATCHDOG_ENABLED: bool = True
+    LOOP_LAG_INTERVAL: float = 0.5
+    LOOP_BLOCK_THRESHOLD: float = 0.2
+    
+    # Data source settings ("nhtsa" for the live API, "vpic_local" for an imported vPIC dump)
+    DATA_SOURCE: str = "nhtsa"
+    VPIC_DB_PATH: str = "data/vpic.sqlite3"
+    VPIC_DUMP_PATH: str = ""
+    
     # External API settings
     NHTSA_BASE_URL: str = "https://vpic.nhtsa.dot.gov/api/vehicles/getmodelsformakeyear"
     MAKE: str = "honda"
+    ALLOWED_MAKES: List[str] = []
+    FLEET_MAKES: List[str] = ["honda", "acura"]
+    MAX_FLEET_MAKES: int = 10
+    FLEET_CONCURRENCY: int = 4
+    MAX_CACHED_MAKES: int = 50
+    CACHE_MAX_YEARS_PER_MAKE: int = 64
     REQUEST_TIMEOUT: int = 10
+    MAX_WORKERS: int = 8
+    MAX_UPSTREAM_CONCURRENCY: int = 16
+    CACHE_TTL_SECONDS: int = 3600
     
     # API limits
     MAX_YEAR_RANGE: int = 15
     MIN_YEAR: int = 1990
     MAX_YEAR: int = 2030
     MIN_DISCONTINUATION_RANGE: int = 3
+    MAX_SEARCH_RESULTS: int = 50
+    MAX_SWEEP_SPAN: int = 40
+    MAX_PAGE_SIZE: int = 1000
+    
+    # Process pool settings (sweeps with at least this many window-years run off the event loop)
+    PROCESS_POOL_WORKERS: int = 0
+    SWEEP_PROCESS_POOL_THRESHOLD: int = 200
+    
+    @model_validator(mode="after")
+    def check_year_quota(self) -> "Settings":
+        """Model timelines need every year from MIN_YEAR to MAX_YEAR cached at once"""
+        year_span = self.MAX_YEAR - self.MIN_YEAR + 1
+        if 0 < self.CACHE_MAX_YEARS_PER_MAKE < year_span:
+            raise ValueError(
+                f"CACHE_MAX_YEARS_PER_MAKE ({self.CACHE_MAX_YEARS_PER_MAKE}) must be 0 (unlimited) or at least "
+                f"MAX_YEAR - MIN_YEAR + 1 ({year_span})"
+            )
+        return self
     
     class Config:
         env_file = ".env"
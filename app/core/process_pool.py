@@ -0,0 +1,33 @@
+# Process pool for CPU-heavy work that must not run on the event loop
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            # Forking a process that runs threads (the event loop, the threadpool,
+            # the watchdog) can copy held locks into the child; start workers
+            # from a clean interpreter instead
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PROCESS_POOL_WORKERS or None,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return _pool
+
+def shutdown_process_pool() -> None:
+    """Shut the shared process pool down, if it was started"""
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
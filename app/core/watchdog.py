@@ -0,0 +1,111 @@
+# Event loop lag watchdog
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class LoopWatchdog:
+    """
+    Measures event loop lag and reports what blocked the loop
+
+    A coroutine wakes every `interval` seconds and records how late it woke
+    up. A daemon thread watches that heartbeat; when the loop has not ticked
+    for longer than `block_threshold`, it logs a stack sample of the loop
+    thread, which shows the blocking call while it is still running.
+
+    The heartbeat never ticks slower than half the block threshold, so a
+    block longer than the threshold always delays a tick, even when it
+    starts and ends between two `interval`s.
+    """
+
+    def __init__(self, interval: float, block_threshold: float):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.heartbeat = min(interval, block_threshold / 2)
+        self.current_lag = 0.0
+        self.max_lag = 0.0
+        self.lag_sum = 0.0
+        self.samples = 0
+        self.stalls = 0
+        self._last_tick = time.monotonic()
+        self._stall_reported = False
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def start(self) -> None:
+        """Start monitoring the running event loop"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._measure())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _measure(self) -> None:
+        while True:
+            expected = time.monotonic() + self.heartbeat
+            await asyncio.sleep(self.heartbeat)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+
+            self.current_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.lag_sum += lag
+            self.samples += 1
+            self._last_tick = now
+            self._stall_reported = False
+
+    def _watch(self) -> None:
+        poll = max(self.block_threshold / 2, 0.01)
+        while not self._stop.wait(poll):
+            blocked_for = time.monotonic() - self._last_tick - self.heartbeat
+            if blocked_for > self.block_threshold and not self._stall_reported:
+                self._stall_reported = True
+                self.stalls += 1
+                self._report_stall(blocked_for)
+
+    def _report_stall(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<loop thread not found>\n"
+        logger.warning(
+            "Event loop blocked for %.3fs (threshold %.3fs); loop thread stack:\n%s",
+            blocked_for, self.block_threshold, stack
+        )
+
+    def metrics(self) -> Dict[str, float]:
+        """Current lag statistics; lag samples are a summary (sum and count)"""
+        return {
+            "event_loop_lag_last_seconds": self.current_lag,
+            "event_loop_lag_max_seconds": self.max_lag,
+            "event_loop_lag_seconds_sum": self.lag_sum,
+            "event_loop_lag_seconds_count": self.samples,
+            "event_loop_stalls_total": self.stalls
+        }
+
+# Shared watchdog started with the application
+loop_watchdog = LoopWatchdog(settings.LOOP_LAG_INTERVAL, settings.LOOP_BLOCK_THRESHOLD)
@@ -1,7 +1,17 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import honda
+from app.routers import honda, fleet, monitoring, admin
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware, response_cache
+from app.core.watchdog import loop_watchdog
+from app.core.process_pool import shutdown_process_pool
+from app.services.changes import model_refresher
+from app.services.honda_service import make_services
+
+async def prepare_data_source() -> None:
+    """Import the local vPIC dump, if configured, before serving requests"""
+    await run_in_threadpool(make_services.source.prepare)
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
@@ -23,8 +33,31 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Add compression middleware (gzip/brotli with cached compressed bodies)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        cache=response_cache,
+    )
+    
     # Include routers
     app.include_router(honda.router, tags=["Honda Models"])
+    app.include_router(fleet.router, tags=["Fleet Analytics"])
+    app.include_router(monitoring.router, tags=["Monitoring"])
+    app.include_router(admin.router, tags=["Admin"])
+    
+    # Load the data source up front so no request waits on an import
+    app.add_event_handler("startup", prepare_data_source)
+    
+    # Measure event loop lag and log stacks of blocking calls
+    if settings.LOOP_WATCHDOG_ENABLED:
+        app.add_event_handler("startup", loop_watchdog.start)
+        app.add_event_handler("shutdown", loop_watchdog.stop)
+    app.add_event_handler("shutdown", shutdown_process_pool)
+    
+    # Periodically refetch years clients subscribed to and push changes
+    app.add_event_handler("startup", model_refresher.start)
+    app.add_event_handler("shutdown", model_refresher.stop)
     
     return app
 
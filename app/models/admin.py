@@ -0,0 +1,76 @@
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional
+
+class CacheEntryInfo(BaseModel):
+    """One cached year"""
+    year: int = Field(..., description="Model year")
+    model_count: int = Field(..., description="Number of cached models")
+    size_bytes: int = Field(..., description="Approximate memory used by the entry")
+    age_seconds: float = Field(..., description="Seconds since the entry was fetched or revalidated")
+    hits: int = Field(..., description="Cache hits served by the entry")
+    fresh: bool = Field(..., description="Whether the entry is within CACHE_TTL_SECONDS")
+    etag: Optional[str] = Field(None, description="ETag of the upstream payload")
+    content_hash: Optional[str] = Field(None, description="Hash of the upstream payload")
+
+class MakeCacheInfo(BaseModel):
+    """Cache partition of one make"""
+    make: str = Field(..., description="Vehicle make")
+    entry_count: int = Field(..., description="Number of cached years")
+    size_bytes: int = Field(..., description="Approximate memory used by the cached years")
+    index_bytes: int = Field(..., description="Approximate memory used by the search index")
+    indexed_models: int = Field(..., description="Model names in the search index")
+    entries: List[CacheEntryInfo] = Field(..., description="Cached years")
+
+class CacheInfoResponse(BaseModel):
+    """Response model for cache introspection"""
+    makes: List[MakeCacheInfo] = Field(..., description="Cache partitions")
+    response_cache: Dict[str, int] = Field(..., description="Compressed response cache entries, bytes, hits and misses")
+    sorted_models_bytes: int = Field(..., description="Approximate memory used by memoized sorted model lists (all makes)")
+    total_bytes: int = Field(..., description="Approximate memory used by model caches, search indexes, sorted lists and responses")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "makes": [
+                    {
+                        "make": "honda",
+                        "entry_count": 1,
+                        "size_bytes": 9120,
+                        "index_bytes": 48240,
+                        "indexed_models": 121,
+                        "entries": [
+                            {
+                                "year": 2022,
+                                "model_count": 121,
+                                "size_bytes": 9120,
+                                "age_seconds": 42.5,
+                                "hits": 17,
+                                "fresh": True,
+                                "content_hash": "5f1c3b0e9a7d4c21b8e6f0a3d2c1b4e5"
+                            }
+                        ]
+                    }
+                ],
+                "response_cache": {"entries": 3, "bytes": 4096, "hits": 12, "misses": 3},
+                "sorted_models_bytes": 1008,
+                "total_bytes": 62464
+            }
+        }
+
+class PurgeResponse(BaseModel):
+    """Response model for a cache purge"""
+    make: str = Field(..., description="Vehicle make")
+    purged_years: List[int] = Field(..., description="Years dropped from the cache and search index")
+    response_cache_cleared: bool = Field(..., description="Whether cached compressed responses were dropped")
+
+class RefreshResult(BaseModel):
+    """Outcome of refreshing one year"""
+    year: int = Field(..., description="Model year")
+    model_count: Optional[int] = Field(None, description="Number of models after the refresh")
+    changed: Optional[bool] = Field(None, description="Whether the model list changed")
+    error: Optional[str] = Field(None, description="Error message if the refresh failed")
+
+class RefreshResponse(BaseModel):
+    """Response model for a forced refresh"""
+    make: str = Field(..., description="Vehicle make")
+    results: List[RefreshResult] = Field(..., description="Outcome per year")
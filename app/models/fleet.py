@@ -0,0 +1,47 @@
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional
+
+class FleetMakeCounts(BaseModel):
+    """Model counts for one make"""
+    make: str = Field(..., description="Vehicle make")
+    yearly_counts: Optional[Dict[int, int]] = Field(None, description="Model counts per year")
+    total_unique_models: Optional[int] = Field(None, description="Unique models across the period")
+    error: Optional[str] = Field(None, description="Error message if this make could not be fetched")
+
+class FleetCountsResponse(BaseModel):
+    """Response model for fleet-wide model counts"""
+    start_year: int = Field(..., description="Starting year of range")
+    end_year: int = Field(..., description="Ending year of range")
+    makes: List[FleetMakeCounts] = Field(..., description="Counts per make")
+    fleet_yearly_counts: Dict[int, int] = Field(..., description="Model counts per year summed across makes")
+    fleet_unique_models: int = Field(..., description="Unique models across all makes")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "start_year": 2022,
+                "end_year": 2023,
+                "makes": [
+                    {"make": "honda", "yearly_counts": {2022: 121, 2023: 110}, "total_unique_models": 130},
+                    {"make": "acura", "yearly_counts": {2022: 6, 2023: 5}, "total_unique_models": 7}
+                ],
+                "fleet_yearly_counts": {2022: 127, 2023: 115},
+                "fleet_unique_models": 137
+            }
+        }
+
+class FleetMakeDiscontinued(BaseModel):
+    """Discontinued models for one make"""
+    make: str = Field(..., description="Vehicle make")
+    early_years_models_count: Optional[int] = Field(None, description="Number of models in early years")
+    recent_years_models_count: Optional[int] = Field(None, description="Number of models in recent years")
+    discontinued_models: Optional[List[str]] = Field(None, description="List of discontinued models")
+    discontinued_count: Optional[int] = Field(None, description="Number of discontinued models")
+    error: Optional[str] = Field(None, description="Error message if this make could not be fetched")
+
+class FleetDiscontinuedResponse(BaseModel):
+    """Response model for fleet-wide discontinuation analysis"""
+    start_year: int = Field(..., description="Starting year of analysis")
+    end_year: int = Field(..., description="Ending year of analysis")
+    makes: List[FleetMakeDiscontinued] = Field(..., description="Discontinued models per make")
+    total_discontinued: int = Field(..., description="Discontinued models across all makes")
@@ -21,8 +21,10 @@ class YearRangeResponse(BaseModel):
     """Response model for year range model query"""
     start_year: int = Field(..., description="Starting year of range")
     end_year: int = Field(..., description="Ending year of range")
-    yearly_data: Dict[int, List[str]] = Field(..., description="Models organized by year")
-    total_unique_models: int = Field(..., description="Total unique models across all years")
+    yearly_data: Optional[Dict[int, List[str]]] = Field(None, description="Models organized by year (full, names)")
+    yearly_counts: Optional[Dict[int, int]] = Field(None, description="Model counts per year (counts)")
+    total_unique_models: Optional[int] = Field(None, description="Total unique models across all years (full, summary)")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
     
     class Config:
         schema_extra = {
@@ -71,6 +73,61 @@ class StatisticsResponse(BaseModel):
     discontinued_models: List[str] = Field(..., description="Sample discontinued models")
     trend_analysis: Dict[str, List[int]] = Field(..., description="Growth and decline years")
 
+class StatisticsSweepResponse(BaseModel):
+    """Response model for sliding-window statistics"""
+    start_year: int = Field(..., description="First year of the sweep span")
+    end_year: int = Field(..., description="Last year of the sweep span")
+    window: int = Field(..., description="Window length in years")
+    total_windows: int = Field(..., description="Number of windows computed")
+    windows: List[StatisticsResponse] = Field(..., description="Statistics for each window, in order")
+
+class SearchResult(BaseModel):
+    """Single model name search match"""
+    name: str = Field(..., description="Model name")
+    years: List[int] = Field(..., description="Cached years the model was sold")
+    score: float = Field(..., description="Relevance score (higher is better)")
+
+class SearchResponse(BaseModel):
+    """Response model for model name search"""
+    query: str = Field(..., description="Search query")
+    results: List[SearchResult] = Field(..., description="Matches ranked by relevance")
+    total_count: int = Field(..., description="Number of matches returned")
+    indexed_models: int = Field(..., description="Number of model names in the index")
+    indexed_years: int = Field(..., description="Number of years the index covers")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "query": "cr",
+                "results": [
+                    {"name": "CR-V", "years": [2020, 2021, 2022], "score": 80.0},
+                    {"name": "CR-Z", "years": [2015, 2016], "score": 80.0}
+                ],
+                "total_count": 2,
+                "indexed_models": 155,
+                "indexed_years": 11
+            }
+        }
+
+class ModelYearsResponse(BaseModel):
+    """Response model for a single model's sales timeline"""
+    name: str = Field(..., description="Model name")
+    years: List[int] = Field(..., description="Sorted years the model was sold")
+    first_year: int = Field(..., description="First year the model was sold")
+    last_year: int = Field(..., description="Most recent year the model was sold")
+    total_years: int = Field(..., description="Number of years the model was sold")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "name": "CR-Z",
+                "years": [2011, 2012, 2013, 2014, 2015, 2016],
+                "first_year": 2011,
+                "last_year": 2016,
+                "total_years": 6
+            }
+        }
+
 class HealthResponse(BaseModel):
     """Response model for health check"""
     status: str = Field(..., description="Health status")
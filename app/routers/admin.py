@@ -0,0 +1,183 @@
+import asyncio
+import secrets
+from fastapi import APIRouter, Depends, HTTPException, Query, Security
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import APIKeyHeader
+from typing import Optional
+from app.models.admin import (
+    CacheInfoResponse,
+    MakeCacheInfo,
+    PurgeResponse,
+    RefreshResponse,
+    RefreshResult
+)
+from app.services.analytics import estimate_sorted_models_bytes
+from app.services.honda_service import make_services, normalize_make
+from app.core.compression import response_cache
+from app.core.config import settings
+
+admin_key_header = APIKeyHeader(name="X-Admin-Key", auto_error=False)
+
+def require_admin_key(api_key: Optional[str] = Security(admin_key_header)) -> None:
+    """Reject requests without the configured admin key"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=503, detail="Admin API is disabled; set ADMIN_API_KEY to enable it")
+    
+    if not api_key or not secrets.compare_digest(api_key.encode(), settings.ADMIN_API_KEY.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing admin key")
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin_key)])
+
+def _normalize_make(make: str) -> str:
+    """Validate a make name, mapping errors to 400"""
+    try:
+        return normalize_make(make)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _check_year_range(start_year: Optional[int], end_year: Optional[int]) -> bool:
+    """Validate an optional inclusive range; returns False when neither bound is given"""
+    if start_year is None and end_year is None:
+        return False
+    if start_year is None or end_year is None:
+        raise HTTPException(status_code=400, detail="start_year and end_year must be given together")
+    if start_year > end_year:
+        raise HTTPException(status_code=400, detail="start_year must be less than or equal to end_year")
+    return True
+
+@router.get(
+    "/cache",
+    response_model=CacheInfoResponse,
+    response_model_exclude_none=True,
+    summary="Inspect Caches",
+    description="List cached years per make with age, size and hit counts"
+)
+async def get_cache_info(
+    make: Optional[str] = Query(None, description="Only show this make (default: every cached make)")
+):
+    """
+    Inspect the model caches
+    
+    - **make**: Optional make to restrict the listing to
+    
+    Sizes are estimates. `size_bytes` covers the cached model names and
+    `index_bytes` the make's search index. `total_bytes` adds the memoized
+    sorted model lists and the compressed response cache.
+    """
+    services = make_services.services()
+    if make is not None:
+        make = _normalize_make(make)
+        services = [service for service in services if service.make == make]
+    
+    makes = []
+    for service in services:
+        entries = service.cache.entries()
+        makes.append(MakeCacheInfo(
+            make=service.make,
+            entry_count=len(entries),
+            size_bytes=sum(entry["size_bytes"] for entry in entries),
+            index_bytes=service.index.memory_bytes(),
+            indexed_models=service.index.stats()["models"],
+            entries=entries
+        ))
+    
+    # The memo is shared by every make, so it is always estimated over all of them
+    sorted_models_bytes = estimate_sorted_models_bytes(
+        entry["model_count"] for service in make_services.services() for entry in service.cache.entries()
+    )
+    response_stats = response_cache.stats()
+    return CacheInfoResponse(
+        makes=makes,
+        response_cache=response_stats,
+        sorted_models_bytes=sorted_models_bytes,
+        total_bytes=(
+            sum(info.size_bytes + info.index_bytes for info in makes)
+            + sorted_models_bytes
+            + response_stats["bytes"]
+        )
+    )
+
+@router.post(
+    "/cache/purge",
+    response_model=PurgeResponse,
+    summary="Purge Cache",
+    description="Drop cached years of a make, with their search index entries and cached responses"
+)
+async def purge_cache(
+    make: str = Query(settings.MAKE, description="Vehicle make"),
+    start_year: Optional[int] = Query(
+        None, description="First year to purge (default: every cached year)", ge=settings.MIN_YEAR, le=settings.MAX_YEAR
+    ),
+    end_year: Optional[int] = Query(
+        None, description="Last year to purge (default: every cached year)", ge=settings.MIN_YEAR, le=settings.MAX_YEAR
+    )
+):
+    """
+    Purge cached years
+    
+    - **make**: Vehicle make
+    - **start_year** / **end_year**: Optional inclusive range; omit both to purge the whole make
+    
+    Purged years are removed from the search index and refetched on their next
+    lookup. Cached compressed responses are dropped too, since they may embed
+    the purged data.
+    """
+    make = _normalize_make(make)
+    has_range = _check_year_range(start_year, end_year)
+    
+    service = make_services.find(make)
+    purged_years = []
+    if service is not None:
+        # Only cached years can be purged, so select among those instead of materializing the range
+        cached_years = service.cache.years()
+        purged_years = service.purge_years(
+            [year for year in cached_years if start_year <= year <= end_year] if has_range else cached_years
+        )
+    if purged_years:
+        response_cache.clear()
+    
+    return PurgeResponse(make=make, purged_years=purged_years, response_cache_cleared=bool(purged_years))
+
+@router.post(
+    "/cache/refresh",
+    response_model=RefreshResponse,
+    response_model_exclude_none=True,
+    summary="Refresh Cache",
+    description="Revalidate a range of years of a make against the data source now"
+)
+async def refresh_cache(
+    make: str = Query(settings.MAKE, description="Vehicle make"),
+    start_year: int = Query(..., description="First year to refresh", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    end_year: int = Query(..., description="Last year to refresh", ge=settings.MIN_YEAR, le=settings.MAX_YEAR)
+):
+    """
+    Force-refresh cached years
+    
+    - **make**: Vehicle make
+    - **start_year** / **end_year**: Inclusive range to refresh
+    
+    Years are revalidated concurrently regardless of cache age; changes reach
+    search and subscribers as with background refreshes. A year that fails is
+    reported with an `error` and keeps its previous cache entry.
+    """
+    make = _normalize_make(make)
+    _check_year_range(start_year, end_year)
+    if end_year - start_year > settings.MAX_YEAR_RANGE:
+        raise HTTPException(status_code=400, detail=f"Year range cannot exceed {settings.MAX_YEAR_RANGE} years")
+    
+    years = list(range(start_year, end_year + 1))
+    service = make_services.get(make)
+    previous = {year: service.cache.peek(year) for year in years}
+    outcomes = await asyncio.gather(
+        *(run_in_threadpool(service.refresh_year, year) for year in years),
+        return_exceptions=True
+    )
+    
+    results = []
+    for year, outcome in zip(years, outcomes):
+        if isinstance(outcome, Exception):
+            results.append(RefreshResult(year=year, error=getattr(outcome, "detail", None) or str(outcome)))
+        else:
+            results.append(RefreshResult(year=year, model_count=len(outcome), changed=outcome != previous[year]))
+    
+    return RefreshResponse(make=make, results=results)
@@ -0,0 +1,154 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from app.models.fleet import (
+    FleetCountsResponse,
+    FleetMakeCounts,
+    FleetDiscontinuedResponse,
+    FleetMakeDiscontinued
+)
+from app.services.analytics import compute_discontinued
+from app.services.honda_service import make_services, normalize_make
+from app.core.config import settings
+
+router = APIRouter()
+
+def _validate(start_year: int, end_year: int, makes: Optional[List[str]]) -> List[str]:
+    """Validate the year range and resolve the list of makes"""
+    if start_year > end_year:
+        raise HTTPException(status_code=400, detail="start_year must be less than or equal to end_year")
+    
+    if end_year - start_year > settings.MAX_YEAR_RANGE:
+        raise HTTPException(status_code=400, detail=f"Year range cannot exceed {settings.MAX_YEAR_RANGE} years")
+    
+    # Only validate names here; services (and cache partitions) are created once the request is accepted
+    try:
+        resolved = list(dict.fromkeys(normalize_make(make) for make in (makes or settings.FLEET_MAKES)))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if len(resolved) > settings.MAX_FLEET_MAKES:
+        raise HTTPException(status_code=400, detail=f"Cannot analyze more than {settings.MAX_FLEET_MAKES} makes at once")
+    return resolved
+
+async def _fetch_fleet(makes: List[str], start_year: int, end_year: int) -> List[Tuple[str, object]]:
+    """
+    Fetch every make's range, FLEET_CONCURRENCY makes at a time
+
+    Failures are returned per make. Upstream requests are further capped
+    across all makes by the data source (MAX_UPSTREAM_CONCURRENCY).
+    """
+    slots = asyncio.Semaphore(max(settings.FLEET_CONCURRENCY, 1))
+    
+    async def fetch(make: str):
+        async with slots:
+            service = make_services.get(make)
+            return await run_in_threadpool(service.get_all_models_in_range, start_year, end_year)
+    
+    results = await asyncio.gather(*(fetch(make) for make in makes), return_exceptions=True)
+    return list(zip(makes, results))
+
+def _error_detail(error: Exception) -> str:
+    return getattr(error, "detail", None) or str(error)
+
+@router.get(
+    "/fleet/counts", 
+    response_model=FleetCountsResponse,
+    response_model_exclude_none=True,
+    summary="Fleet-Wide Model Counts",
+    description="Get per-year model counts for many makes at once"
+)
+async def get_fleet_counts(
+    start_year: int = Query(..., description="Starting year", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    end_year: int = Query(..., description="Ending year", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    makes: Optional[List[str]] = Query(None, description="Makes to include (repeat the parameter); defaults to FLEET_MAKES")
+):
+    """
+    Get model counts across a fleet of makes
+    
+    - **start_year**: Starting year (inclusive)
+    - **end_year**: Ending year (inclusive)
+    - **makes**: Makes to include, e.g. `?makes=honda&makes=acura`
+    
+    Makes are fetched concurrently, each from its own cache partition. A make
+    that fails to load is reported with an `error` instead of failing the request.
+    """
+    resolved = _validate(start_year, end_year, makes)
+    
+    entries = []
+    fleet_yearly_counts: Dict[int, int] = {year: 0 for year in range(start_year, end_year + 1)}
+    fleet_unique_models = 0
+    
+    for make, result in await _fetch_fleet(resolved, start_year, end_year):
+        if isinstance(result, Exception):
+            entries.append(FleetMakeCounts(make=make, error=_error_detail(result)))
+            continue
+        
+        yearly_models: Dict[int, FrozenSet[str]] = result
+        yearly_counts = {year: len(models) for year, models in yearly_models.items()}
+        total_unique = len(frozenset().union(*yearly_models.values()))
+        for year, count in yearly_counts.items():
+            fleet_yearly_counts[year] += count
+        fleet_unique_models += total_unique
+        entries.append(FleetMakeCounts(make=make, yearly_counts=yearly_counts, total_unique_models=total_unique))
+    
+    return FleetCountsResponse(
+        start_year=start_year,
+        end_year=end_year,
+        makes=entries,
+        fleet_yearly_counts=fleet_yearly_counts,
+        fleet_unique_models=fleet_unique_models
+    )
+
+@router.get(
+    "/fleet/discontinued", 
+    response_model=FleetDiscontinuedResponse,
+    response_model_exclude_none=True,
+    summary="Fleet-Wide Discontinued Models",
+    description="Find discontinued models for many makes at once"
+)
+async def get_fleet_discontinued(
+    start_year: int = Query(..., description="Starting year of analysis", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    end_year: int = Query(..., description="Ending year of analysis", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    makes: Optional[List[str]] = Query(None, description="Makes to include (repeat the parameter); defaults to FLEET_MAKES")
+):
+    """
+    Find discontinued models across a fleet of makes
+    
+    Uses the same definition as `/models/discontinued`: sold at least once from
+    start_year to (end_year-2) but not in the last 2 years. Makes are fetched
+    concurrently; a make that fails to load is reported with an `error`.
+    """
+    resolved = _validate(start_year, end_year, makes)
+    if end_year - start_year < settings.MIN_DISCONTINUATION_RANGE:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Year range must be at least {settings.MIN_DISCONTINUATION_RANGE} years for discontinuation analysis"
+        )
+    
+    entries = []
+    total_discontinued = 0
+    
+    for make, result in await _fetch_fleet(resolved, start_year, end_year):
+        if isinstance(result, Exception):
+            entries.append(FleetMakeDiscontinued(make=make, error=_error_detail(result)))
+            continue
+        
+        analysis = compute_discontinued(result, start_year, end_year)
+        discontinued_list = sorted(analysis["discontinued_models"])
+        total_discontinued += len(discontinued_list)
+        entries.append(FleetMakeDiscontinued(
+            make=make,
+            early_years_models_count=len(analysis["early_years_models"]),
+            recent_years_models_count=len(analysis["recent_years_models"]),
+            discontinued_models=discontinued_list,
+            discontinued_count=len(discontinued_list)
+        ))
+    
+    return FleetDiscontinuedResponse(
+        start_year=start_year,
+        end_year=end_year,
+        makes=entries,
+        total_discontinued=total_discontinued
+    )
@@ -1,18 +1,86 @@
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+import base64
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from datetime import datetime
+from typing import Dict, FrozenSet, List, Literal, Optional, Tuple
 from app.models.honda import (
     ModelResponse, 
     YearRangeResponse, 
     DiscontinuedResponse, 
     StatisticsResponse, 
+    StatisticsSweepResponse,
+    SearchResponse,
+    ModelYearsResponse,
     HealthResponse,
     ErrorResponse
 )
-from app.services.honda_service import honda_service
+from app.services.honda_service import HondaModelsService, make_services
+from app.services.analytics import compute_statistics_sweep, sorted_models
+from app.services.changes import change_broker, format_sse
 from app.core.config import settings
+from app.core.process_pool import get_process_pool
 
 router = APIRouter()
 
+def get_make_service(
+    make: str = Query(settings.MAKE, description="Vehicle make (e.g. honda, acura, toyota)")
+) -> HondaModelsService:
+    """Resolve the `make` query parameter to that make's service"""
+    try:
+        return make_services.get(make)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _encode_cursor(year: int, offset: int) -> str:
+    """Encode a (year, model offset) position as an opaque cursor"""
+    return base64.urlsafe_b64encode(f"{year}:{offset}".encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        year_text, offset_text = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+        return int(year_text), int(offset_text)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _walk_names(
+    service: HondaModelsService,
+    yearly_models: Dict[int, FrozenSet[str]],
+    page_year: int,
+    offset: int,
+    end_year: int,
+    limit: Optional[int]
+) -> Tuple[Dict[int, List[str]], Optional[str]]:
+    """
+    Walk years from the cursor, taking up to `limit` sorted model names
+    
+    Years missing from `yearly_models` are fetched as the walk reaches them,
+    so this blocks and must run in a worker thread.
+    
+    Returns:
+        Tuple[Dict[int, List[str]], Optional[str]]: Names by year, and the next cursor if there is more
+    """
+    yearly_data = {}
+    remaining = limit
+    for year in range(page_year, end_year + 1):
+        start = offset if year == page_year else 0
+        if remaining == 0:
+            return yearly_data, _encode_cursor(year, start)
+        models = yearly_models.get(year)
+        if models is None:
+            models = service.get_models_for_year(year)
+        models_list = sorted_models(models)
+        page = models_list[start:] if remaining is None else models_list[start:start + remaining]
+        yearly_data[year] = list(page)
+        if remaining is not None:
+            remaining -= len(page)
+            if start + len(page) < len(models_list):
+                return yearly_data, _encode_cursor(year, start + len(page))
+    return yearly_data, None
+
 @router.get("/", response_model=dict, summary="API Information")
 async def root():
     """Get API information and available endpoints"""
@@ -25,7 +93,14 @@ async def root():
             "GET /models/range": "Get Honda models for a year range",
             "GET /models/discontinued": "Find discontinued Honda models",
             "GET /models/statistics": "Get comprehensive statistics",
+            "GET /models/statistics/sweep": "Get statistics for every sliding window in a span",
+            "GET /models/search": "Search model names across cached years",
+            "GET /models/by-name/{name}/years": "Get every year a model was sold",
+            "GET /models/subscribe": "Stream model list changes (Server-Sent Events)",
+            "GET /fleet/counts": "Get model counts across many makes",
+            "GET /fleet/discontinued": "Find discontinued models across many makes",
             "GET /health": "Health check endpoint",
+            "GET /metrics": "Runtime metrics (Prometheus format)",
             "GET /docs": "Interactive API documentation"
         },
         "data_source": "NHTSA Vehicle Database",
@@ -33,13 +108,14 @@ async def root():
     }
 
 @router.get(
-    "/models/{year}", 
+    "/models/{year:int}", 
     response_model=ModelResponse,
     summary="Get Models for Year",
     description="Get all Honda models available for a specific year"
 )
 async def get_models_for_year(
-    year: int
+    year: int,
+    service: HondaModelsService = Depends(get_make_service)
 ):
     """
     Get all Honda models for a specific year
@@ -55,8 +131,8 @@ async def get_models_for_year(
             detail=f"Year must be between {settings.MIN_YEAR} and {settings.MAX_YEAR}"
         )
     try:
-        models_set = honda_service.get_models_for_year(year)
-        models_list = sorted(list(models_set))
+        models_set = service.get_models_for_year(year)
+        models_list = list(sorted_models(models_set))
         
         return ModelResponse(
             year=year,
@@ -71,18 +147,30 @@ async def get_models_for_year(
 @router.get(
     "/models/range", 
     response_model=YearRangeResponse,
+    response_model_exclude_none=True,
     summary="Get Models for Year Range",
     description="Get all Honda models for a range of years"
 )
 async def get_models_for_range(
     start_year: int = Query(..., description="Starting year", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
-    end_year: int = Query(..., description="Ending year", ge=settings.MIN_YEAR, le=settings.MAX_YEAR)
+    end_year: int = Query(..., description="Ending year", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    fields: Literal["full", "names", "counts", "summary"] = Query("full", description="Which fields to return"),
+    limit: Optional[int] = Query(None, description="Page size (model names, or years for counts)", ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    service: HondaModelsService = Depends(get_make_service)
 ):
     """
     Get all Honda models for a range of years
     
     - **start_year**: Starting year (inclusive)
     - **end_year**: Ending year (inclusive)
+    - **fields**: Projection of the response
+        - `full` (default): `yearly_data` and `total_unique_models`
+        - `names`: `yearly_data` only
+        - `counts`: `yearly_counts` only, model names are never sorted or serialized
+        - `summary`: `total_unique_models` only
+    - **limit**: Page size; model names per page for `full`/`names`, years per page for `counts`
+    - **cursor**: `next_cursor` from the previous page
     
     Returns models organized by year with comprehensive statistics.
     Maximum range is limited to 15 years for performance.
@@ -94,24 +182,37 @@ async def get_models_for_range(
     if end_year - start_year > settings.MAX_YEAR_RANGE:
         raise HTTPException(status_code=400, detail=f"Year range cannot exceed {settings.MAX_YEAR_RANGE} years")
     
+    page_year, offset = _decode_cursor(cursor) if cursor else (start_year, 0)
+    if not start_year <= page_year <= end_year or offset < 0:
+        raise HTTPException(status_code=400, detail="Cursor does not belong to this year range")
+    
     try:
-        yearly_models = honda_service.get_all_models_in_range(start_year, end_year)
+        response = YearRangeResponse(start_year=start_year, end_year=end_year)
         
-        # Convert sets to sorted lists for JSON serialization
-        yearly_data = {}
-        all_unique_models = set()
+        if fields == "counts":
+            # Only the years on this page are needed
+            page_end = end_year if limit is None else min(end_year, page_year + limit - 1)
+            yearly_models = service.get_all_models_in_range(page_year, page_end)
+            response.yearly_counts = {year: len(models) for year, models in yearly_models.items()}
+            if page_end < end_year:
+                response.next_cursor = _encode_cursor(page_end + 1, 0)
+            return response
         
-        for year, models_set in yearly_models.items():
-            models_list = sorted(list(models_set))
-            yearly_data[year] = models_list
-            all_unique_models.update(models_set)
+        if fields in ("full", "summary"):
+            yearly_models = service.get_all_models_in_range(start_year, end_year)
+            response.total_unique_models = len(frozenset().union(*yearly_models.values()))
+            if fields == "summary":
+                return response
+        elif limit is None:
+            yearly_models = service.get_all_models_in_range(page_year, end_year)
+        else:
+            # Paged names: fetch years one at a time, stopping once the page is full
+            yearly_models = {}
         
-        return YearRangeResponse(
-            start_year=start_year,
-            end_year=end_year,
-            yearly_data=yearly_data,
-            total_unique_models=len(all_unique_models)
+        response.yearly_data, response.next_cursor = await run_in_threadpool(
+            _walk_names, service, yearly_models, page_year, offset, end_year, limit
         )
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -125,7 +226,8 @@ async def get_models_for_range(
 )
 async def get_discontinued_models(
     start_year: int = Query(..., description="Starting year of analysis", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
-    end_year: int = Query(..., description="Ending year of analysis", ge=settings.MIN_YEAR, le=settings.MAX_YEAR)
+    end_year: int = Query(..., description="Ending year of analysis", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    service: HondaModelsService = Depends(get_make_service)
 ):
     """
     Find discontinued Honda models
@@ -156,7 +258,7 @@ async def get_discontinued_models(
         raise HTTPException(status_code=400, detail=f"Year range cannot exceed {settings.MAX_YEAR_RANGE} years")
     
     try:
-        result = honda_service.find_discontinued_models(start_year, end_year)
+        result = service.find_discontinued_models(start_year, end_year)
         
         discontinued_list = sorted(list(result["discontinued_models"]))
         
@@ -181,7 +283,8 @@ async def get_discontinued_models(
 )
 async def get_models_statistics(
     start_year: int = Query(2015, description="Starting year for statistics", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
-    end_year: int = Query(2025, description="Ending year for statistics", ge=settings.MIN_YEAR, le=settings.MAX_YEAR)
+    end_year: int = Query(2025, description="Ending year for statistics", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    service: HondaModelsService = Depends(get_make_service)
 ):
     """
     Get comprehensive statistics about Honda models
@@ -205,7 +308,7 @@ async def get_models_statistics(
         raise HTTPException(status_code=400, detail=f"Year range cannot exceed {settings.MAX_YEAR_RANGE} years")
     
     try:
-        statistics = honda_service.get_comprehensive_statistics(start_year, end_year)
+        statistics = service.get_comprehensive_statistics(start_year, end_year)
         
         return StatisticsResponse(**statistics)
     except HTTPException:
@@ -213,13 +316,201 @@ async def get_models_statistics(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@router.get(
+    "/models/statistics/sweep", 
+    response_model=StatisticsSweepResponse,
+    summary="Get Sliding-Window Statistics",
+    description="Get comprehensive statistics for every sliding window in a span"
+)
+async def get_statistics_sweep(
+    start_year: int = Query(..., description="First year of the span", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    end_year: int = Query(..., description="Last year of the span", ge=settings.MIN_YEAR, le=settings.MAX_YEAR),
+    window: int = Query(..., description="Window length in years", ge=1, le=settings.MAX_YEAR_RANGE + 1),
+    service: HondaModelsService = Depends(get_make_service)
+):
+    """
+    Get statistics for every window in a span at once
+    
+    - **start_year**: First year of the span
+    - **end_year**: Last year of the span (inclusive)
+    - **window**: Window length in years
+    
+    **Example:** start_year=2000, end_year=2012, window=11 returns the
+    `/models/statistics` result for 2000-2010, 2001-2011 and 2002-2012.
+    
+    Every year is fetched once and the windows are computed in a single
+    incremental pass; large sweeps run in a process pool off the event loop.
+    """
+    # Validation
+    if start_year > end_year:
+        raise HTTPException(status_code=400, detail="start_year must be less than or equal to end_year")
+    
+    if end_year - start_year > settings.MAX_SWEEP_SPAN:
+        raise HTTPException(status_code=400, detail=f"Sweep span cannot exceed {settings.MAX_SWEEP_SPAN} years")
+    
+    if window > end_year - start_year + 1:
+        raise HTTPException(status_code=400, detail="window cannot be longer than the span")
+    
+    try:
+        yearly_models = await run_in_threadpool(service.get_all_models_in_range, start_year, end_year)
+        
+        total_windows = end_year - start_year - window + 2
+        if total_windows * window >= settings.SWEEP_PROCESS_POOL_THRESHOLD:
+            sweep = await asyncio.get_running_loop().run_in_executor(
+                get_process_pool(), compute_statistics_sweep, yearly_models, start_year, end_year, window
+            )
+        else:
+            sweep = compute_statistics_sweep(yearly_models, start_year, end_year, window)
+        
+        return StatisticsSweepResponse(
+            start_year=start_year,
+            end_year=end_year,
+            window=window,
+            total_windows=len(sweep),
+            windows=[StatisticsResponse(**statistics) for statistics in sweep]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@router.get(
+    "/models/search", 
+    response_model=SearchResponse,
+    summary="Search Models",
+    description="Search Honda model names across all cached years"
+)
+async def search_models(
+    q: str = Query(..., description="Full or partial model name", min_length=1),
+    limit: int = Query(10, description="Maximum number of results", ge=1, le=settings.MAX_SEARCH_RESULTS),
+    service: HondaModelsService = Depends(get_make_service)
+):
+    """
+    Search Honda model names (autocomplete)
+    
+    - **q**: Full or partial model name, case and punctuation insensitive ("crv" matches "CR-V")
+    - **limit**: Maximum number of results
+    
+    Results are ranked exact, prefix, word prefix, substring, then fuzzy matches,
+    and include the years each model was sold. Only years already fetched are
+    searched; no upstream calls are made.
+    """
+    results = service.search_models(q, limit)
+    index_stats = service.index.stats()
+    
+    return SearchResponse(
+        query=q,
+        results=results,
+        total_count=len(results),
+        indexed_models=index_stats["models"],
+        indexed_years=index_stats["years"]
+    )
+
+@router.get(
+    "/models/by-name/{name}/years", 
+    response_model=ModelYearsResponse,
+    summary="Get Years for Model",
+    description="Get every year a Honda model was sold"
+)
+async def get_model_years(
+    name: str,
+    service: HondaModelsService = Depends(get_make_service)
+):
+    """
+    Get the sales timeline for a single Honda model
+    
+    - **name**: Model name, case and punctuation insensitive (e.g. CR-Z, crz)
+    
+    Answered from an inverted model -> years index. Years not cached yet are
+    fetched once; after that, lookups make no upstream calls.
+    """
+    try:
+        result = await run_in_threadpool(service.get_model_years, name)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Model '{name}' not found")
+    
+    years = result["years"]
+    return ModelYearsResponse(
+        name=result["name"],
+        years=years,
+        first_year=years[0],
+        last_year=years[-1],
+        total_years=len(years)
+    )
+
+@router.get(
+    "/models/subscribe", 
+    response_class=StreamingResponse,
+    summary="Subscribe to Model Changes",
+    description="Stream added and removed Honda models for a set of years as Server-Sent Events"
+)
+async def subscribe_model_changes(
+    request: Request,
+    years: List[int] = Query(..., description="Years to watch (repeat the parameter for several years)"),
+    service: HondaModelsService = Depends(get_make_service)
+):
+    """
+    Subscribe to model list changes with Server-Sent Events
+    
+    - **years**: Years to watch, e.g. `?years=2025&years=2026`
+    
+    The stream starts with a `subscribed` event. Subscribed years are
+    refetched in the background every REFRESH_INTERVAL_SECONDS, and a
+    `models_changed` event with the added and removed models is pushed
+    whenever a year's model list changes. Comment heartbeats keep idle
+    connections open.
+    """
+    watched = frozenset(years)
+    if len(watched) > settings.MAX_SUBSCRIPTION_YEARS:
+        raise HTTPException(status_code=400, detail=f"Cannot subscribe to more than {settings.MAX_SUBSCRIPTION_YEARS} years")
+    
+    if any(year < settings.MIN_YEAR or year > settings.MAX_YEAR for year in watched):
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Year must be between {settings.MIN_YEAR} and {settings.MAX_YEAR}"
+        )
+    
+    # Establish the baseline the first refresh is compared against
+    baseline = {}
+    for year in sorted(watched):
+        baseline[year] = await run_in_threadpool(service.get_models_for_year, year)
+    
+    async def event_stream():
+        # Subscribe only once streaming starts, so a client that disconnects
+        # before the response begins never leaves a subscription behind
+        subscription = change_broker.subscribe(service.make, watched, baseline)
+        try:
+            yield format_sse("subscribed", {"years": sorted(watched)})
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse("models_changed", event)
+        finally:
+            change_broker.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get(
     "/health", 
     response_model=HealthResponse,
     summary="Health Check",
     description="Check API health and external service connectivity"
 )
-async def health_check():
+async def health_check(
+    service: HondaModelsService = Depends(get_make_service)
+):
     """
     Health check endpoint
     
@@ -230,7 +521,7 @@ async def health_check():
     """
     try:
         # Test API connectivity
-        test_result = honda_service.test_api_connectivity()
+        test_result = service.test_api_connectivity()
         
         return HealthResponse(
             status=test_result["status"],
@@ -0,0 +1,47 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.watchdog import loop_watchdog
+
+router = APIRouter()
+
+METRIC_TYPES = {
+    "event_loop_lag_last_seconds": ("gauge", "Most recent event loop lag"),
+    "event_loop_lag_max_seconds": ("gauge", "Largest event loop lag observed"),
+    "event_loop_lag_seconds": ("summary", "Event loop lag per heartbeat"),
+    "event_loop_stalls_total": ("counter", "Loop stalls longer than the block threshold"),
+}
+
+def _family(name: str) -> str:
+    """Metric family a sample belongs to (summary samples end in _sum or _count)"""
+    for suffix in ("_sum", "_count"):
+        base = name[:-len(suffix)]
+        if name.endswith(suffix) and METRIC_TYPES.get(base, ("",))[0] == "summary":
+            return base
+    return name
+
+@router.get(
+    "/metrics", 
+    response_class=PlainTextResponse,
+    summary="Metrics",
+    description="Runtime metrics in Prometheus text format"
+)
+async def metrics():
+    """
+    Runtime metrics in Prometheus text exposition format
+    
+    - Event loop lag (latest, max, and a summary of all samples)
+    - Number of loop stalls longer than LOOP_BLOCK_THRESHOLD
+    """
+    lines = []
+    described = set()
+    for name, value in loop_watchdog.metrics().items():
+        family = _family(name)
+        if family not in described:
+            described.add(family)
+            metric_type, description = METRIC_TYPES[family]
+            lines += [
+                f"# HELP {family} {description}",
+                f"# TYPE {family} {metric_type}"
+            ]
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,260 @@
+import heapq
+import struct
+import sys
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, AbstractSet, Mapping
+
+YearlyModels = Mapping[int, AbstractSet[str]]
+
+def slice_years(yearly_models: YearlyModels, start_year: int, end_year: int) -> Dict[int, AbstractSet[str]]:
+    """
+    Restrict yearly model data to an inclusive year window
+
+    Args:
+        yearly_models (Mapping[int, Set[str]]): Models keyed by year
+        start_year (int): Starting year
+        end_year (int): Ending year (inclusive)
+
+    Returns:
+        Dict[int, Set[str]]: Models for the years inside the window
+    """
+    return {
+        year: yearly_models[year]
+        for year in range(start_year, end_year + 1)
+        if year in yearly_models
+    }
+
+@lru_cache(maxsize=1024)
+def sorted_models(models: FrozenSet[str]) -> Tuple[str, ...]:
+    """
+    Sorted model names for a cached year, memoized
+
+    Cached years hand out the same frozenset on every hit, so repeat
+    requests (and later pages of a paginated response) reuse one sort.
+    """
+    return tuple(sorted(models))
+
+def estimate_sorted_models_bytes(model_counts: Iterable[int]) -> int:
+    """
+    Approximate memory held by the sorted_models memo
+
+    The memo is keyed by cached years' model sets and shares their name
+    strings, so each memoized year costs one tuple of pointers. At most
+    `currsize` years are memoized; the largest are assumed.
+
+    Args:
+        model_counts (Iterable[int]): Model counts of the cached years
+
+    Returns:
+        int: Estimated bytes
+    """
+    memoized = sorted(model_counts, reverse=True)[:sorted_models.cache_info().currsize]
+    pointer_size = struct.calcsize("P")
+    return sum(sys.getsizeof(()) + pointer_size * count for count in memoized)
+
+def compute_discontinued(yearly_models: YearlyModels, start_year: int, end_year: int) -> Dict:
+    """
+    Compute discontinued models from already-fetched yearly data
+
+    Definition of discontinued: Any model that was sold at least once from
+    start_year to (end_year-2) but not sold in the last 2 years (end_year-1, end_year)
+
+    Args:
+        yearly_models (Mapping[int, Set[str]]): Models keyed by year
+        start_year (int): Starting year of analysis
+        end_year (int): Ending year of analysis
+
+    Returns:
+        Dict: Early, recent and discontinued model sets
+    """
+    # Get models from all years except the last 2
+    early_years_models = set()
+    for year in range(start_year, end_year - 1):  # end_year - 2 years
+        if year in yearly_models:
+            early_years_models.update(yearly_models[year])
+
+    # Get models from the last 2 years
+    last_two_years_models = set()
+    for year in range(end_year - 1, end_year + 1):  # Last 2 years
+        if year in yearly_models:
+            last_two_years_models.update(yearly_models[year])
+
+    # Discontinued = models that existed in early years but not in last 2 years
+    discontinued_models = early_years_models - last_two_years_models
+
+    return {
+        "early_years_models": early_years_models,
+        "recent_years_models": last_two_years_models,
+        "discontinued_models": discontinued_models
+    }
+
+def compute_statistics(
+    yearly_models: YearlyModels,
+    start_year: int,
+    end_year: int,
+    discontinued: Optional[Dict] = None
+) -> Dict:
+    """
+    Compute comprehensive statistics from already-fetched yearly data
+
+    Args:
+        yearly_models (Mapping[int, Set[str]]): Models keyed by year
+        start_year (int): Starting year for analysis
+        end_year (int): Ending year for analysis
+        discontinued (Optional[Dict]): compute_discontinued result for the same
+            window, if the caller already has it
+
+    Returns:
+        Dict: Comprehensive statistics and analysis
+    """
+    window = slice_years(yearly_models, start_year, end_year)
+
+    # Calculate statistics
+    yearly_counts = {}
+    all_models: Set[str] = set()
+
+    for year, models in window.items():
+        yearly_counts[year] = len(models)
+        all_models.update(models)
+
+    # Find peak and lowest years
+    peak_year = max(yearly_counts, key=yearly_counts.get)
+    lowest_year = min(yearly_counts, key=yearly_counts.get)
+
+    # Calculate average
+    avg_models_per_year = sum(yearly_counts.values()) / len(yearly_counts) if yearly_counts else 0
+
+    # Find discontinued models
+    discontinued_result = discontinued
+    if discontinued_result is None:
+        discontinued_result = compute_discontinued(window, start_year, end_year)
+
+    # Trend analysis
+    growth_years = []
+    decline_years = []
+
+    for year in range(start_year + 1, end_year + 1):
+        current_count = yearly_counts.get(year, 0)
+        previous_count = yearly_counts.get(year - 1, 0)
+
+        if current_count > previous_count:
+            growth_years.append(year)
+        elif current_count < previous_count:
+            decline_years.append(year)
+
+    return {
+        "analysis_period": f"{start_year}-{end_year}",
+        "total_unique_models": len(all_models),
+        "yearly_model_counts": yearly_counts,
+        "peak_year": {
+            "year": peak_year,
+            "model_count": yearly_counts[peak_year]
+        },
+        "lowest_year": {
+            "year": lowest_year,
+            "model_count": yearly_counts[lowest_year]
+        },
+        "average_models_per_year": round(avg_models_per_year, 1),
+        "discontinued_models_count": len(discontinued_result["discontinued_models"]),
+        "discontinued_models": sorted(list(discontinued_result["discontinued_models"]))[:10],
+        "trend_analysis": {
+            "growth_years": growth_years,
+            "decline_years": decline_years
+        }
+    }
+
+def _add_models(counter: Counter, models: AbstractSet[str]) -> None:
+    for model in models:
+        counter[model] += 1
+
+def _remove_models(counter: Counter, models: AbstractSet[str]) -> None:
+    for model in models:
+        counter[model] -= 1
+        if not counter[model]:
+            del counter[model]
+
+def compute_statistics_sweep(yearly_models: YearlyModels, start_year: int, end_year: int, window: int) -> List[Dict]:
+    """
+    Compute comprehensive statistics for every sliding window in a span
+
+    Produces the same result as calling compute_statistics for each window
+    (start_year..start_year+window-1, then shifted by one year), but in one
+    incremental pass: per-model occurrence counters are updated only for the
+    year entering and the year leaving each window, instead of re-unioning
+    every year of every window.
+
+    Args:
+        yearly_models (Mapping[int, Set[str]]): Models keyed by year
+        start_year (int): First year of the span
+        end_year (int): Last year of the span (inclusive)
+        window (int): Window length in years
+
+    Returns:
+        List[Dict]: Statistics for each window, in order
+    """
+    empty: AbstractSet[str] = frozenset()
+
+    def models_for(year: int) -> AbstractSet[str]:
+        return yearly_models.get(year, empty)
+
+    counts = {year: len(yearly_models[year]) for year in range(start_year, end_year + 1) if year in yearly_models}
+
+    # Models seen anywhere in the window, and in its "early" part (all but the last 2 years)
+    window_counter: Counter = Counter()
+    early_counter: Counter = Counter()
+    for year in range(start_year, start_year + window):
+        _add_models(window_counter, models_for(year))
+    for year in range(start_year, start_year + window - 2):
+        _add_models(early_counter, models_for(year))
+
+    results = []
+    for window_start in range(start_year, end_year - window + 2):
+        window_end = window_start + window - 1
+        if window_start > start_year:
+            _remove_models(window_counter, models_for(window_start - 1))
+            _add_models(window_counter, models_for(window_end))
+            if window > 2:
+                _remove_models(early_counter, models_for(window_start - 1))
+                _add_models(early_counter, models_for(window_end - 2))
+
+        yearly_counts = {year: counts[year] for year in range(window_start, window_end + 1) if year in counts}
+        peak_year = max(yearly_counts, key=yearly_counts.get)
+        lowest_year = min(yearly_counts, key=yearly_counts.get)
+        avg_models_per_year = sum(yearly_counts.values()) / len(yearly_counts)
+
+        recent_models = set(models_for(window_end - 1)) | set(models_for(window_end))
+        discontinued_models = [model for model in early_counter if model not in recent_models]
+
+        growth_years = []
+        decline_years = []
+        for year in range(window_start + 1, window_end + 1):
+            current_count = yearly_counts.get(year, 0)
+            previous_count = yearly_counts.get(year - 1, 0)
+            if current_count > previous_count:
+                growth_years.append(year)
+            elif current_count < previous_count:
+                decline_years.append(year)
+
+        results.append({
+            "analysis_period": f"{window_start}-{window_end}",
+            "total_unique_models": len(window_counter),
+            "yearly_model_counts": yearly_counts,
+            "peak_year": {
+                "year": peak_year,
+                "model_count": yearly_counts[peak_year]
+            },
+            "lowest_year": {
+                "year": lowest_year,
+                "model_count": yearly_counts[lowest_year]
+            },
+            "average_models_per_year": round(avg_models_per_year, 1),
+            "discontinued_models_count": len(discontinued_models),
+            "discontinued_models": heapq.nsmallest(10, discontinued_models),
+            "trend_analysis": {
+                "growth_years": growth_years,
+                "decline_years": decline_years
+            }
+        })
+
+    return results
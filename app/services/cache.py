@@ -0,0 +1,182 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from app.services.data_sources import Validators
+
+def estimate_size(models: FrozenSet[str]) -> int:
+    """Approximate memory used by a set of model names, in bytes"""
+    return sys.getsizeof(models) + sum(sys.getsizeof(model) for model in models)
+
+@dataclass
+class CacheEntry:
+    """Cached models for a single year"""
+    models: FrozenSet[str]
+    fetched_at: float
+    hits: int = 0
+    validators: Optional[Validators] = None
+    size_bytes: int = 0
+
+class ModelCache:
+    """
+    Thread-safe in-memory cache of models per year
+
+    Entries older than the TTL are treated as missing so the next lookup
+    refetches them; a TTL of 0 disables expiry. When more than `max_entries`
+    years are cached, the least recently used year is evicted and passed to
+    `on_evict` so derived data can be dropped too.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_entries: int = 0,
+        on_evict: Optional[Callable[[int, FrozenSet[str]], None]] = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[int, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return not self.ttl_seconds or time.monotonic() - entry.fetched_at < self.ttl_seconds
+
+    def get(self, year: int) -> Optional[FrozenSet[str]]:
+        """
+        Get cached models for a year
+
+        Args:
+            year (int): The model year
+
+        Returns:
+            Optional[FrozenSet[str]]: Cached models, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(year)
+            if entry is None or not self._is_fresh(entry):
+                return None
+            entry.hits += 1
+            self._entries.move_to_end(year)
+            return entry.models
+
+    def peek(self, year: int) -> Optional[FrozenSet[str]]:
+        """Get cached models for a year regardless of age, without counting a hit"""
+        with self._lock:
+            entry = self._entries.get(year)
+            return entry.models if entry is not None else None
+
+    def missing(self, years: Iterable[int]) -> List[int]:
+        """Years that are not cached or have expired, without counting hits"""
+        with self._lock:
+            return [
+                year for year in years
+                if year not in self._entries or not self._is_fresh(self._entries[year])
+            ]
+
+    def validators(self, year: int) -> Optional[Validators]:
+        """Validators of the cached payload for a year regardless of age"""
+        with self._lock:
+            entry = self._entries.get(year)
+            return entry.validators if entry is not None else None
+
+    def revalidated(self, year: int, validators: Validators) -> Optional[FrozenSet[str]]:
+        """
+        Mark a year's cached models as fresh again without replacing them
+
+        Returns:
+            Optional[FrozenSet[str]]: The cached models, or None if the year was evicted meanwhile
+        """
+        with self._lock:
+            entry = self._entries.get(year)
+            if entry is None:
+                return None
+            entry.fetched_at = time.monotonic()
+            entry.validators = validators
+            self._entries.move_to_end(year)
+            return entry.models
+
+    def set(
+        self,
+        year: int,
+        models: FrozenSet[str],
+        validators: Optional[Validators] = None
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Store models for a year
+
+        Returns:
+            Optional[FrozenSet[str]]: The previously cached models, if any
+        """
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(year, None)
+            self._entries[year] = CacheEntry(
+                models=models,
+                fetched_at=time.monotonic(),
+                validators=validators,
+                size_bytes=estimate_size(models)
+            )
+            while self.max_entries and len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False))
+
+        if self.on_evict is not None:
+            for evicted_year, entry in evicted:
+                self.on_evict(evicted_year, entry.models)
+        return previous.models if previous is not None else None
+
+    def remove(self, years: Iterable[int]) -> List[int]:
+        """
+        Drop cached years, passing each to `on_evict` like an eviction
+
+        Returns:
+            List[int]: Sorted years that were actually cached
+        """
+        removed = []
+        with self._lock:
+            for year in years:
+                entry = self._entries.pop(year, None)
+                if entry is not None:
+                    removed.append((year, entry))
+
+        if self.on_evict is not None:
+            for year, entry in removed:
+                self.on_evict(year, entry.models)
+        return sorted(year for year, _ in removed)
+
+    def entries(self) -> List[Dict]:
+        """Snapshot of every cached year with its age, size and hit count"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "year": year,
+                    "model_count": len(entry.models),
+                    "size_bytes": entry.size_bytes,
+                    "age_seconds": round(now - entry.fetched_at, 3),
+                    "hits": entry.hits,
+                    "fresh": self._is_fresh(entry),
+                    "etag": entry.validators.etag if entry.validators else None,
+                    "content_hash": entry.validators.content_hash if entry.validators else None
+                }
+                for year, entry in sorted(self._entries.items())
+            ]
+
+    def memory_bytes(self) -> int:
+        """Approximate memory used by all cached models, in bytes"""
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def years(self) -> List[int]:
+        """Sorted list of cached years, including expired ones"""
+        with self._lock:
+            return sorted(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached year, passing each to `on_evict` like remove()"""
+        with self._lock:
+            years = list(self._entries)
+        self.remove(years)
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.honda_service import MakeServiceRegistry, make_services
+
+logger = logging.getLogger(__name__)
+
+def format_sse(event: str, data: Dict) -> str:
+    """Format a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+class Subscription:
+    """A client's interest in a set of years of one make, and its pending events"""
+
+    def __init__(self, make: str, years: FrozenSet[int], queue_size: int):
+        self.make = make
+        self.years = years
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.loop = asyncio.get_running_loop()
+
+    def offer(self, event: Dict) -> None:
+        """Queue an event, dropping the oldest one if the client is falling behind"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+class ModelChangeBroker:
+    """
+    Fans out model list changes to subscribed clients
+
+    publish() is registered as a HondaModelsService change listener and may
+    be called from worker threads; events are handed to each subscriber's
+    event loop thread-safely. The broker keeps the last model set seen for
+    every subscribed (make, year) and diffs against it, so changes are still
+    reported when the service cache lost the year to a purge or eviction.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._snapshots: Dict[Tuple[str, int], FrozenSet[str]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self,
+        make: str,
+        years: FrozenSet[int],
+        baseline: Optional[Dict[int, FrozenSet[str]]] = None
+    ) -> Subscription:
+        """
+        Subscribe to changes for a set of years of a make (call from the event loop)
+
+        Args:
+            make (str): Normalized make name
+            years (FrozenSet[int]): Years to watch
+            baseline (Optional[Dict[int, FrozenSet[str]]]): Current models by year,
+                used as the starting snapshot for years nobody is watching yet
+
+        Returns:
+            Subscription: The new subscription
+        """
+        subscription = Subscription(make, years, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+            for year, models in (baseline or {}).items():
+                self._snapshots.setdefault((make, year), models)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscription, forgetting snapshots nobody watches"""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            watched = {
+                (other.make, year)
+                for other in self._subscriptions
+                for year in other.years
+            }
+            for year in subscription.years:
+                if (subscription.make, year) not in watched:
+                    self._snapshots.pop((subscription.make, year), None)
+
+    def subscribed_years(self) -> Dict[str, Set[int]]:
+        """Every year at least one client is subscribed to, by make"""
+        with self._lock:
+            subscribed: Dict[str, Set[int]] = {}
+            for subscription in self._subscriptions:
+                subscribed.setdefault(subscription.make, set()).update(subscription.years)
+            return subscribed
+
+    def publish(self, make: str, year: int, models: FrozenSet[str]) -> None:
+        """Deliver the difference from the last snapshot to every subscriber of the make and year"""
+        with self._lock:
+            subscriptions = [
+                subscription for subscription in self._subscriptions
+                if subscription.make == make and year in subscription.years
+            ]
+            if not subscriptions:
+                return
+            previous = self._snapshots.get((make, year))
+            self._snapshots[(make, year)] = models
+
+        if previous is None or previous == models:
+            return
+        event = {
+            "make": make,
+            "year": year,
+            "added": sorted(models - previous),
+            "removed": sorted(previous - models),
+            "timestamp": datetime.now().isoformat()
+        }
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.offer, event)
+
+class ModelRefresher:
+    """Background task that periodically refetches every subscribed year"""
+
+    def __init__(self, services: MakeServiceRegistry, broker: ModelChangeBroker, interval: float):
+        self.services = services
+        self.broker = broker
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the refresh loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh_once(self) -> None:
+        """Refetch all subscribed years; changes reach subscribers via the broker"""
+        targets = [
+            (make, year)
+            for make, years in sorted(self.broker.subscribed_years().items())
+            for year in sorted(years)
+        ]
+        results = await asyncio.gather(
+            *(run_in_threadpool(self.services.get(make).refresh_year, year) for make, year in targets),
+            return_exceptions=True
+        )
+        for (make, year), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning("Background refresh failed for %s %s: %s", make, year, result)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh_once()
+
+# Shared broker and refresher for the application
+change_broker = ModelChangeBroker(settings.SSE_QUEUE_SIZE)
+make_services.add_change_listener(change_broker.publish)
+model_refresher = ModelRefresher(make_services, change_broker, settings.REFRESH_INTERVAL_SECONDS)
@@ -0,0 +1,355 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+import requests
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+def content_hash(content: bytes) -> str:
+    """Digest identifying a payload's exact bytes"""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+@dataclass(frozen=True)
+class Validators:
+    """What is known about the last payload fetched for a (make, year)"""
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+@dataclass(frozen=True)
+class FetchResult:
+    """
+    Outcome of a conditional fetch
+
+    `models` is None when the payload is unchanged since `validators` were
+    issued, in which case it was not parsed.
+    """
+    models: Optional[Set[str]]
+    validators: Validators
+
+class ModelDataSource(ABC):
+    """Where HondaModelsService gets model names from"""
+
+    name: str = ""
+
+    def prepare(self) -> None:
+        """Get ready to answer queries; called once at application startup"""
+
+    def fetch_models_if_changed(self, make: str, year: int, previous: Optional[Validators] = None) -> FetchResult:
+        """
+        Fetch models for a make and year unless they are unchanged
+
+        The default implementation fetches the full result and compares a hash
+        of the sorted model names; sources that can revalidate more cheaply
+        override it.
+
+        Args:
+            make (str): Vehicle make (e.g. "honda")
+            year (int): The model year
+            previous (Optional[Validators]): Validators from the last fetch, if any
+
+        Returns:
+            FetchResult: New models and validators, or models=None if unchanged
+
+        Raises:
+            HTTPException: If the source cannot answer
+        """
+        models = self.fetch_models(make, year)
+        validators = Validators(content_hash("\n".join(sorted(models)).encode("utf-8")))
+        if previous is not None and previous.content_hash == validators.content_hash:
+            return FetchResult(None, validators)
+        return FetchResult(models, validators)
+
+    @abstractmethod
+    def fetch_models(self, make: str, year: int) -> Set[str]:
+        """
+        Fetch all models for a make and year
+
+        Args:
+            make (str): Vehicle make (e.g. "honda")
+            year (int): The model year
+
+        Returns:
+            Set[str]: Set of model names
+
+        Raises:
+            HTTPException: If the source cannot answer
+        """
+
+class NHTSAHttpSource(ModelDataSource):
+    """
+    Live NHTSA vPIC web API
+
+    At most `max_concurrency` requests are in flight at once across every
+    make and thread sharing this source (0 means unlimited).
+    """
+
+    name = "nhtsa"
+
+    def __init__(self, base_url: str, timeout: int, max_concurrency: int = 0):
+        self.base_url = base_url
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+
+    def fetch_models(self, make: str, year: int) -> Set[str]:
+        return self.fetch_models_if_changed(make, year).models
+
+    def fetch_models_if_changed(self, make: str, year: int, previous: Optional[Validators] = None) -> FetchResult:
+        """
+        Fetch models, revalidating against the previous payload
+
+        Sends If-None-Match / If-Modified-Since when the previous response
+        carried an ETag / Last-Modified. A 304, or a 200 whose body is
+        byte-identical to the previous one, is reported as unchanged without
+        parsing the JSON.
+        """
+        headers = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        try:
+            url = f"{self.base_url}/make/{make}/modelyear/{year}?format=json"
+            if self._slots is None:
+                response = requests.get(url, timeout=self.timeout, headers=headers)
+            else:
+                with self._slots:
+                    response = requests.get(url, timeout=self.timeout, headers=headers)
+
+            if previous is not None and response.status_code == 304:
+                return FetchResult(None, Validators(
+                    previous.content_hash,
+                    etag=response.headers.get("ETag") or previous.etag,
+                    last_modified=response.headers.get("Last-Modified") or previous.last_modified
+                ))
+            response.raise_for_status()
+
+            validators = Validators(
+                content_hash(response.content),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+            if previous is not None and previous.content_hash == validators.content_hash:
+                return FetchResult(None, validators)
+
+            data = response.json()
+
+            # Extract model names from the response
+            models = set()
+            if 'Results' in data and data['Results']:
+                for result in data['Results']:
+                    if 'Model_Name' in result and result['Model_Name']:
+                        models.add(result['Model_Name'].strip())
+
+            return FetchResult(models, validators)
+
+        except requests.exceptions.Timeout:
+            raise HTTPException(
+                status_code=504,
+                detail=f"Request timeout while fetching data for year {year}"
+            )
+        except requests.exceptions.RequestException as e:
+            raise HTTPException(
+                status_code=502,
+                detail=f"Error fetching data for year {year}: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Internal error processing data for year {year}: {str(e)}"
+            )
+
+# Column names accepted for each field in vPIC exports (matched case-insensitively)
+_MAKE_COLUMNS = ("make_name", "make", "makename")
+_MODEL_COLUMNS = ("model_name", "model", "modelname")
+_YEAR_COLUMNS = ("model_year", "modelyear", "year")
+
+def _pick(record: Dict[str, str], columns: Tuple[str, ...]) -> Optional[str]:
+    for column in columns:
+        value = record.get(column)
+        if value not in (None, ""):
+            return str(value).strip()
+    return None
+
+def _open_dump(path: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, encoding="utf-8-sig", newline="")
+
+def read_vpic_dump(path: str) -> Iterator[Tuple[str, int, str]]:
+    """
+    Read (make, year, model) rows from a vPIC export
+
+    Accepts CSV with a header row, JSON (a list of records or an API-style
+    {"Results": [...]} object) or JSON lines, optionally gzip-compressed.
+    Each record needs a make, model and model year column, e.g. the vPIC
+    Make_Name, Model_Name and Model_Year fields.
+
+    Args:
+        path (str): Path to the export file
+
+    Yields:
+        Tuple[str, int, str]: Lowercase make, model year and model name
+    """
+    base, extension = os.path.splitext(path[:-3] if path.endswith(".gz") else path)
+    with _open_dump(path) as handle:
+        if extension.lower() == ".csv":
+            records: Iterable[Dict] = csv.DictReader(handle)
+        elif extension.lower() in (".jsonl", ".ndjson"):
+            records = (json.loads(line) for line in handle if line.strip())
+        else:
+            data = json.load(handle)
+            records = data.get("Results", []) if isinstance(data, dict) else data
+
+        for record in records:
+            record = {str(key).lower(): value for key, value in record.items()}
+            make = _pick(record, _MAKE_COLUMNS)
+            model = _pick(record, _MODEL_COLUMNS)
+            year = _pick(record, _YEAR_COLUMNS)
+            if not (make and model and year):
+                continue
+            try:
+                yield make.lower(), int(float(year)), model
+            except ValueError:
+                continue
+
+class VPICLocalSource(ModelDataSource):
+    """
+    Local SQLite store imported from a vPIC database export
+
+    Answers every query from disk with no network access. The store is
+    indexed by (make, model_year), so lookups are a single index range scan.
+    """
+
+    name = "vpic_local"
+
+    def __init__(self, db_path: str, dump_path: Optional[str] = None):
+        self.db_path = db_path
+        self.dump_path = dump_path
+        self._local = threading.local()
+        self._import_lock = threading.Lock()
+        self._checked = False
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.db_path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS vpic_models ("
+                "make TEXT NOT NULL, model_year INTEGER NOT NULL, model_name TEXT NOT NULL, "
+                "PRIMARY KEY (make, model_year, model_name)) WITHOUT ROWID"
+            )
+            self._local.connection = connection
+        return connection
+
+    def is_empty(self) -> bool:
+        """Whether no data has been imported yet"""
+        return self._connection().execute("SELECT 1 FROM vpic_models LIMIT 1").fetchone() is None
+
+    def import_dump(self, path: str, replace: bool = True) -> int:
+        """
+        Import a vPIC export into the local store
+
+        Args:
+            path (str): Path to the export file (see read_vpic_dump)
+            replace (bool): Drop existing rows before importing
+
+        Returns:
+            int: Number of rows read from the export
+        """
+        with self._import_lock:
+            return self._import(path, replace)
+
+    def _import(self, path: str, replace: bool) -> int:
+        """Import an export; the caller must hold _import_lock"""
+        connection = self._connection()
+        count = 0
+        with connection:
+            if replace:
+                connection.execute("DELETE FROM vpic_models")
+            batch = []
+            for row in read_vpic_dump(path):
+                batch.append(row)
+                count += 1
+                if len(batch) >= 10000:
+                    connection.executemany("INSERT OR IGNORE INTO vpic_models VALUES (?, ?, ?)", batch)
+                    batch = []
+            connection.executemany("INSERT OR IGNORE INTO vpic_models VALUES (?, ?, ?)", batch)
+        return count
+
+    def prepare(self) -> None:
+        """
+        Import the configured dump if the store is empty
+
+        Called at application startup so requests never wait on an import.
+        Without a dump path, an empty store is left for `import-vpic` to fill.
+        """
+        if self.dump_path:
+            self._ensure_loaded()
+
+    def _ensure_loaded(self) -> None:
+        if self._checked:
+            return
+        # Concurrent first requests must not each import (and replace) the dump
+        with self._import_lock:
+            if self._checked:
+                return
+            if self.is_empty():
+                if not self.dump_path:
+                    raise HTTPException(
+                        status_code=503,
+                        detail="Local vPIC store is empty; import a dump with `python -m app.cli import-vpic`"
+                    )
+                self._import(self.dump_path, replace=True)
+            self._checked = True
+
+    def fetch_models(self, make: str, year: int) -> Set[str]:
+        try:
+            self._ensure_loaded()
+            rows = self._connection().execute(
+                "SELECT model_name FROM vpic_models WHERE make = ? AND model_year = ?",
+                (make.lower(), year)
+            )
+            return {model_name for (model_name,) in rows}
+        except HTTPException:
+            raise
+        except (OSError, ValueError, sqlite3.Error) as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error reading local vPIC data for year {year}: {str(e)}"
+            )
+
+def create_data_source(name: Optional[str] = None) -> ModelDataSource:
+    """
+    Create the data source selected by Settings.DATA_SOURCE
+
+    Args:
+        name (Optional[str]): Source name, defaults to settings.DATA_SOURCE
+
+    Returns:
+        ModelDataSource: Configured data source
+
+    Raises:
+        ValueError: If the source name is unknown
+    """
+    name = name or settings.DATA_SOURCE
+    if name == NHTSAHttpSource.name:
+        return NHTSAHttpSource(settings.NHTSA_BASE_URL, settings.REQUEST_TIMEOUT, settings.MAX_UPSTREAM_CONCURRENCY)
+    if name == VPICLocalSource.name:
+        return VPICLocalSource(settings.VPIC_DB_PATH, settings.VPIC_DUMP_PATH or None)
+    raise ValueError(f"Unknown data source '{name}', expected 'nhtsa' or 'vpic_local'")
@@ -1,19 +1,154 @@
-import requests
-from typing import Set, Dict
-from fastapi import HTTPException
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Set, Dict, FrozenSet, Iterable, List, Optional
 from app.core.config import settings
+from app.services.analytics import compute_discontinued, compute_statistics, sorted_models
+from app.services.cache import ModelCache
+from app.services.data_sources import ModelDataSource, Validators, create_data_source
+from app.services.model_index import ModelIndex
+
+logger = logging.getLogger(__name__)
+
+# Called with (make, year, models) whenever a year's stored models differ from the cached ones
+ChangeListener = Callable[[str, int, FrozenSet[str]], None]
+
+_VALID_MAKE = re.compile(r"^[a-z0-9][a-z0-9 &.\-]{0,49}$")
+
+def normalize_make(make: str) -> str:
+    """
+    Normalize and validate a vehicle make name
+    
+    Args:
+        make (str): Make name in any case (e.g. "Honda", "mercedes-benz")
+        
+    Returns:
+        str: Lowercase make name
+        
+    Raises:
+        ValueError: If the make is malformed or not in ALLOWED_MAKES
+    """
+    normalized = make.strip().lower()
+    if not _VALID_MAKE.match(normalized):
+        raise ValueError(f"Invalid make '{make}'")
+    if settings.ALLOWED_MAKES and normalized not in settings.ALLOWED_MAKES:
+        raise ValueError(f"Make '{make}' is not supported")
+    return normalized
 
 class HondaModelsService:
-    """Service class for Honda models business logic"""
+    """Service class for vehicle models business logic, for one make (Honda by default)"""
+    
+    def __init__(self, make: Optional[str] = None, source: Optional[ModelDataSource] = None):
+        self.make = make or settings.MAKE
+        self.source = source or create_data_source()
+        self.max_workers = settings.MAX_WORKERS
+        self.index = ModelIndex()
+        self.cache = ModelCache(
+            settings.CACHE_TTL_SECONDS,
+            max_entries=settings.CACHE_MAX_YEARS_PER_MAKE,
+            on_evict=self.index.remove_year
+        )
+        self._change_listeners: List[ChangeListener] = []
+        # Serializes cache writes with the index updates and evictions they cause
+        self._store_lock = threading.Lock()
+    
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """
+        Register a callback for changes to a cached year's models
+        
+        Listeners receive the full model set, including when a year is stored
+        again after being purged or evicted, and are expected to diff it
+        against whatever they last saw. They run on whichever thread stored
+        the new data and must not block.
+        """
+        self._change_listeners.append(listener)
+    
+    def _store_models(self, year: int, models: FrozenSet[str], validators: Optional[Validators] = None) -> None:
+        """Cache and index freshly fetched models, notifying listeners of changes"""
+        with self._store_lock:
+            previous = self.cache.set(year, models, validators)
+            if previous == models:
+                return
+            self.index.update_year(year, models, previous)
+        
+        for listener in self._change_listeners:
+            try:
+                listener(self.make, year, models)
+            except Exception:
+                # A broken listener must not fail the fetch or starve the others
+                logger.exception("Change listener failed for %s %s", self.make, year)
+    
+    def get_models_for_year(self, year: int) -> FrozenSet[str]:
+        """
+        Get all Honda models for a given year, using the cache when fresh
+        
+        Args:
+            year (int): The model year
+            
+        Returns:
+            FrozenSet[str]: Set of model names for the given year
+            
+        Raises:
+            HTTPException: If the data source request fails
+        """
+        models = self.cache.get(year)
+        if models is None:
+            models = self.refresh_year(year)
+        return models
+    
+    def refresh_year(self, year: int) -> FrozenSet[str]:
+        """
+        Revalidate a year regardless of cache age and store the result
+        
+        The data source is asked conditionally using the validators of the
+        cached payload. If it is unchanged, the cached entry is only marked
+        fresh: nothing is parsed, reindexed or reported to listeners.
+        
+        Args:
+            year (int): The model year
+            
+        Returns:
+            FrozenSet[str]: Current set of model names for the year
+            
+        Raises:
+            HTTPException: If the data source request fails
+        """
+        result = self.source.fetch_models_if_changed(self.make, year, self.cache.validators(year))
+        if result.models is None:
+            models = self.cache.revalidated(year, result.validators)
+            if models is not None:
+                return models
+            # Evicted while revalidating, so there is nothing to keep
+            result = self.source.fetch_models_if_changed(self.make, year)
+        
+        models = frozenset(result.models)
+        self._store_models(year, models, result.validators)
+        return models
     
-    def __init__(self):
-        self.base_url = settings.NHTSA_BASE_URL
-        self.make = settings.MAKE
-        self.timeout = settings.REQUEST_TIMEOUT
+    def purge_years(self, years: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Drop cached years and everything derived from them
+        
+        Purged years are removed from the search index as well, and are
+        refetched on their next lookup.
+        
+        Args:
+            years (Optional[Iterable[int]]): Years to drop, defaults to every cached year
+            
+        Returns:
+            List[int]: Sorted years that were cached and have been dropped
+        """
+        with self._store_lock:
+            purged = self.cache.remove(self.cache.years() if years is None else years)
+        if purged:
+            sorted_models.cache_clear()
+        return purged
     
-    def get_models_for_year(self, year: int) -> Set[str]:
+    def fetch_models_for_year(self, year: int) -> Set[str]:
         """
-        Get all Honda models for a given year from NHTSA API
+        Fetch all Honda models for a given year from the data source, bypassing the cache
         
         Args:
             year (int): The model year
@@ -22,41 +157,11 @@ class HondaModelsService:
             Set[str]: Set of model names for the given year
             
         Raises:
-            HTTPException: If API request fails
+            HTTPException: If the data source request fails
         """
-        try:
-            url = f"{self.base_url}/make/{self.make}/modelyear/{year}?format=json"
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract model names from the response
-            models = set()
-            if 'Results' in data and data['Results']:
-                for result in data['Results']:
-                    if 'Model_Name' in result and result['Model_Name']:
-                        models.add(result['Model_Name'].strip())
-            
-            return models
-            
-        except requests.exceptions.Timeout:
-            raise HTTPException(
-                status_code=504, 
-                detail=f"Request timeout while fetching data for year {year}"
-            )
-        except requests.exceptions.RequestException as e:
-            raise HTTPException(
-                status_code=502, 
-                detail=f"Error fetching data for year {year}: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Internal error processing data for year {year}: {str(e)}"
-            )
+        return self.source.fetch_models(self.make, year)
     
-    def get_all_models_in_range(self, start_year: int, end_year: int) -> Dict[int, Set[str]]:
+    def get_all_models_in_range(self, start_year: int, end_year: int) -> Dict[int, FrozenSet[str]]:
         """
         Get all Honda models for a range of years
         
@@ -65,14 +170,20 @@ class HondaModelsService:
             end_year (int): Ending year (inclusive)
             
         Returns:
-            Dict[int, Set[str]]: Dictionary mapping year to set of models
+            Dict[int, FrozenSet[str]]: Dictionary mapping year to set of models
         """
-        all_models = {}
+        years = list(range(start_year, end_year + 1))
+        all_models = {year: self.cache.get(year) for year in years}
+        missing = [year for year, models in all_models.items() if models is None]
         
-        for year in range(start_year, end_year + 1):
-            models = self.get_models_for_year(year)
-            all_models[year] = models
+        if len(missing) <= 1 or self.max_workers <= 1:
+            for year in missing:
+                all_models[year] = self.get_models_for_year(year)
+            return all_models
         
+        # Years are independent upstream calls, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+            all_models.update(zip(missing, executor.map(self.get_models_for_year, missing)))
         return all_models
     
     def find_discontinued_models(self, start_year: int, end_year: int) -> Dict:
@@ -92,27 +203,9 @@ class HondaModelsService:
         # Get all models for each year
         yearly_models = self.get_all_models_in_range(start_year, end_year)
         
-        # Get models from all years except the last 2
-        early_years_models = set()
-        for year in range(start_year, end_year - 1):  # end_year - 2 years
-            if year in yearly_models:
-                early_years_models.update(yearly_models[year])
-        
-        # Get models from the last 2 years
-        last_two_years_models = set()
-        for year in range(end_year - 1, end_year + 1):  # Last 2 years
-            if year in yearly_models:
-                last_two_years_models.update(yearly_models[year])
-        
-        # Discontinued = models that existed in early years but not in last 2 years
-        discontinued_models = early_years_models - last_two_years_models
-        
-        return {
-            "early_years_models": early_years_models,
-            "recent_years_models": last_two_years_models,
-            "discontinued_models": discontinued_models,
-            "yearly_models": yearly_models
-        }
+        result = compute_discontinued(yearly_models, start_year, end_year)
+        result["yearly_models"] = yearly_models
+        return result
     
     def get_comprehensive_statistics(self, start_year: int, end_year: int) -> Dict:
         """
@@ -127,57 +220,44 @@ class HondaModelsService:
         """
         yearly_models = self.get_all_models_in_range(start_year, end_year)
         
-        # Calculate statistics
-        yearly_counts = {}
-        all_models = set()
-        
-        for year, models in yearly_models.items():
-            yearly_counts[year] = len(models)
-            all_models.update(models)
-        
-        # Find peak and lowest years
-        peak_year = max(yearly_counts, key=yearly_counts.get)
-        lowest_year = min(yearly_counts, key=yearly_counts.get)
-        
-        # Calculate average
-        avg_models_per_year = sum(yearly_counts.values()) / len(yearly_counts) if yearly_counts else 0
-        
-        # Find discontinued models
-        discontinued_result = self.find_discontinued_models(start_year, end_year)
-        
-        # Trend analysis
-        growth_years = []
-        decline_years = []
-        
-        for year in range(start_year + 1, end_year + 1):
-            current_count = yearly_counts.get(year, 0)
-            previous_count = yearly_counts.get(year - 1, 0)
-            
-            if current_count > previous_count:
-                growth_years.append(year)
-            elif current_count < previous_count:
-                decline_years.append(year)
-        
-        return {
-            "analysis_period": f"{start_year}-{end_year}",
-            "total_unique_models": len(all_models),
-            "yearly_model_counts": yearly_counts,
-            "peak_year": {
-                "year": peak_year,
-                "model_count": yearly_counts[peak_year]
-            },
-            "lowest_year": {
-                "year": lowest_year,
-                "model_count": yearly_counts[lowest_year]
-            },
-            "average_models_per_year": round(avg_models_per_year, 1),
-            "discontinued_models_count": len(discontinued_result["discontinued_models"]),
-            "discontinued_models": sorted(list(discontinued_result["discontinued_models"]))[:10],
-            "trend_analysis": {
-                "growth_years": growth_years,
-                "decline_years": decline_years
-            }
-        }
+        return compute_statistics(yearly_models, start_year, end_year)
+    
+    def search_models(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Search model names across all cached years
+        
+        Args:
+            query (str): Full or partial model name
+            limit (int): Maximum number of results
+            
+        Returns:
+            List[Dict]: Matches ranked by relevance, with the years each was sold
+        """
+        return self.index.search(query, limit)
+    
+    def get_model_years(self, name: str) -> Optional[Dict]:
+        """
+        Get every year a model was sold from the inverted model -> years index
+        
+        Years between MIN_YEAR and MAX_YEAR that are not cached yet are fetched
+        (in parallel) first; once warm, this makes no upstream calls.
+        
+        Args:
+            name (str): Model name, matched case and punctuation insensitively
+            
+        Returns:
+            Optional[Dict]: Model name and sorted years, or None if never sold
+        """
+        missing = self.cache.missing(range(settings.MIN_YEAR, settings.MAX_YEAR + 1))
+        if missing:
+            self.get_all_models_in_range(missing[0], missing[-1])
+        
+        match = self.index.years_for(name)
+        if match is None:
+            return None
+        
+        model_name, years = match
+        return {"name": model_name, "years": years}
     
     def test_api_connectivity(self) -> Dict:
         """
@@ -187,7 +267,7 @@ class HondaModelsService:
             Dict: Test results
         """
         try:
-            test_models = self.get_models_for_year(2020)
+            test_models = self.fetch_models_for_year(2020)
             return {
                 "status": "healthy",
                 "api_connectivity": "ok",
@@ -200,5 +280,77 @@ class HondaModelsService:
                 "error": str(e)
             }
 
-# Create service instance
-honda_service = HondaModelsService()
+class MakeServiceRegistry:
+    """
+    One HondaModelsService per make, each with its own cache partition
+    
+    Services are created on first use and share a single data source. At
+    most MAX_CACHED_MAKES partitions are kept; the least recently used make
+    (other than the default make) is dropped beyond that.
+    """
+    
+    def __init__(self, source: Optional[ModelDataSource] = None):
+        self.source = source or create_data_source()
+        self._services: "OrderedDict[str, HondaModelsService]" = OrderedDict()
+        self._change_listeners: List[ChangeListener] = []
+        self._lock = threading.Lock()
+    
+    def get(self, make: Optional[str] = None) -> HondaModelsService:
+        """
+        Get the service for a make, creating it if needed
+        
+        Args:
+            make (Optional[str]): Make name, defaults to settings.MAKE
+            
+        Returns:
+            HondaModelsService: Service bound to the make
+            
+        Raises:
+            ValueError: If the make is invalid or not allowed
+        """
+        make = normalize_make(make or settings.MAKE)
+        with self._lock:
+            service = self._services.get(make)
+            if service is not None:
+                self._services.move_to_end(make)
+                return service
+            
+            service = HondaModelsService(make=make, source=self.source)
+            for listener in self._change_listeners:
+                service.add_change_listener(listener)
+            self._services[make] = service
+            
+            while len(self._services) > max(settings.MAX_CACHED_MAKES, 1):
+                evictable = next((name for name in self._services if name not in (settings.MAKE, make)), None)
+                if evictable is None:
+                    break
+                del self._services[evictable]
+            return service
+    
+    def find(self, make: str) -> Optional[HondaModelsService]:
+        """
+        Get the service for a make only if it already exists
+        
+        Raises:
+            ValueError: If the make is invalid or not allowed
+        """
+        make = normalize_make(make)
+        with self._lock:
+            return self._services.get(make)
+    
+    def services(self) -> List[HondaModelsService]:
+        """Services for every make currently cached"""
+        with self._lock:
+            return list(self._services.values())
+    
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Register a change listener on every current and future make service"""
+        with self._lock:
+            self._change_listeners.append(listener)
+            services = list(self._services.values())
+        for service in services:
+            service.add_change_listener(listener)
+
+# Create service instances
+make_services = MakeServiceRegistry()
+honda_service = make_services.get(settings.MAKE)
@@ -0,0 +1,230 @@
+import re
+import sys
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Relevance scores by match type; ties are broken by shorter names first
+EXACT_SCORE = 100.0
+PREFIX_SCORE = 80.0
+WORD_PREFIX_SCORE = 60.0
+SUBSTRING_SCORE = 40.0
+FUZZY_SCORE = 20.0
+FUZZY_MIN_SIMILARITY = 0.4
+
+def normalize(text: str) -> str:
+    """Normalize a model name or query for matching ("CR-V" -> "crv")"""
+    return _NON_ALNUM.sub("", text.casefold())
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalized key, padded so short keys still index"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class ModelIndex:
+    """
+    Incremental in-memory search index over model names
+
+    Keeps an inverted index of the sorted years each model was seen in, a
+    sorted key list for prefix lookups and a trigram index for substring and
+    fuzzy matches. Updated as years are fetched, so it only covers years
+    already loaded.
+    """
+
+    def __init__(self):
+        self._years: Dict[str, List[int]] = {}
+        self._names_by_key: Dict[str, Set[str]] = {}
+        self._words: Dict[str, List[str]] = {}
+        self._sorted_keys: List[str] = []
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._key_trigrams: Dict[str, Set[str]] = {}
+        self._indexed_years: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def update_year(self, year: int, models: AbstractSet[str], previous: Optional[AbstractSet[str]] = None) -> None:
+        """
+        Record the models sold in a year
+
+        Args:
+            year (int): The model year
+            models (Set[str]): Models now known for the year
+            previous (Optional[Set[str]]): Models previously recorded for the year
+        """
+        with self._lock:
+            for name in (previous or set()) - models:
+                self._remove_year(name, year)
+            for name in models:
+                years = self._years.get(name)
+                if years is None:
+                    self._add_name(name)
+                    years = self._years[name] = []
+                position = bisect_left(years, year)
+                if position == len(years) or years[position] != year:
+                    years.insert(position, year)
+            self._indexed_years.add(year)
+
+    def remove_year(self, year: int, models: AbstractSet[str]) -> None:
+        """
+        Forget a year entirely
+
+        Args:
+            year (int): The model year
+            models (Set[str]): Models currently recorded for the year
+        """
+        with self._lock:
+            for name in models:
+                self._remove_year(name, year)
+            self._indexed_years.discard(year)
+
+    def _add_name(self, name: str) -> None:
+        key = normalize(name)
+        if key not in self._names_by_key:
+            self._names_by_key[key] = set()
+            insort(self._sorted_keys, key)
+            self._key_trigrams[key] = trigrams(key)
+            for gram in self._key_trigrams[key]:
+                self._trigrams.setdefault(gram, set()).add(key)
+        self._names_by_key[key].add(name)
+        self._words[name] = [word for word in _NON_ALNUM.split(name.casefold()) if word]
+
+    def _remove_year(self, name: str, year: int) -> None:
+        years = self._years.get(name)
+        if years is None:
+            return
+        position = bisect_left(years, year)
+        if position < len(years) and years[position] == year:
+            del years[position]
+        if years:
+            return
+
+        # Last year for this name is gone; drop it from every structure
+        del self._years[name]
+        del self._words[name]
+        key = normalize(name)
+        names = self._names_by_key[key]
+        names.discard(name)
+        if not names:
+            del self._names_by_key[key]
+            del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+            for gram in self._key_trigrams.pop(key):
+                keys = self._trigrams[gram]
+                keys.discard(key)
+                if not keys:
+                    del self._trigrams[gram]
+
+    def _score(self, query: str, query_gram_count: int, shared_grams: int, key: str, name: str) -> float:
+        if key == query:
+            return EXACT_SCORE
+        if key.startswith(query):
+            return PREFIX_SCORE
+        if query in key:
+            # A word prefix is always a substring of the key, so only check words here
+            if any(word.startswith(query) for word in self._words[name]):
+                return WORD_PREFIX_SCORE
+            return SUBSTRING_SCORE
+        similarity = 2 * shared_grams / (query_gram_count + len(self._key_trigrams[key]))
+        return FUZZY_SCORE * similarity if similarity >= FUZZY_MIN_SIMILARITY else 0.0
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Find models matching a query, ranked by relevance
+
+        Args:
+            query (str): Full or partial model name
+            limit (int): Maximum number of results
+
+        Returns:
+            List[Dict]: Matches with name, sorted years and score
+        """
+        query_key = normalize(query)
+        if not query_key:
+            return []
+
+        query_grams = trigrams(query_key)
+        with self._lock:
+            # Anything sharing a trigram may be a substring, word or fuzzy match
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self._trigrams.get(gram, ()))
+
+            # Prefix matches come straight from the sorted key list
+            position = bisect_left(self._sorted_keys, query_key)
+            while position < len(self._sorted_keys) and self._sorted_keys[position].startswith(query_key):
+                shared[self._sorted_keys[position]] += 0
+                position += 1
+
+            matches = []
+            for key, shared_grams in shared.items():
+                for name in self._names_by_key[key]:
+                    score = self._score(query_key, len(query_grams), shared_grams, key, name)
+                    if score > 0:
+                        matches.append((score, name))
+
+            matches.sort(key=lambda match: (-match[0], len(match[1]), match[1]))
+            return [
+                {"name": name, "years": list(self._years[name]), "score": round(score, 1)}
+                for score, name in matches[:limit]
+            ]
+
+    def years_for(self, name: str) -> Optional[Tuple[str, List[int]]]:
+        """
+        Look up the years a model was sold
+
+        Exact names are a single dict lookup; otherwise the name is matched
+        case and punctuation insensitively ("cr-z", "CRZ" -> "CR-Z").
+
+        Args:
+            name (str): Model name
+
+        Returns:
+            Optional[Tuple[str, List[int]]]: Indexed model name and its sorted years,
+            or None if the model has not been seen
+        """
+        with self._lock:
+            years = self._years.get(name)
+            if years is not None:
+                return name, list(years)
+
+            names = self._names_by_key.get(normalize(name))
+            if not names:
+                return None
+            if len(names) == 1:
+                (match,) = names
+                return match, list(self._years[match])
+
+            # Spelling variants of one model: report the most common spelling
+            match = max(sorted(names), key=lambda variant: len(self._years[variant]))
+            return match, sorted(set().union(*(self._years[variant] for variant in names)))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of indexed models and years"""
+        with self._lock:
+            return {"models": len(self._years), "years": len(self._indexed_years)}
+
+    def memory_bytes(self) -> int:
+        """Approximate memory used by the index, not counting model names it shares with the cache"""
+        with self._lock:
+            size = sum(sys.getsizeof(structure) for structure in (
+                self._years, self._names_by_key, self._words, self._sorted_keys,
+                self._trigrams, self._key_trigrams, self._indexed_years
+            ))
+            size += sum(sys.getsizeof(years) for years in self._years.values())
+            size += sum(sys.getsizeof(key) + sys.getsizeof(names) for key, names in self._names_by_key.items())
+            size += sum(sys.getsizeof(words) + sum(map(sys.getsizeof, words)) for words in self._words.values())
+            size += sum(sys.getsizeof(gram) + sys.getsizeof(keys) for gram, keys in self._trigrams.items())
+            size += sum(sys.getsizeof(grams) for grams in self._key_trigrams.values())
+            return size
+
+    def clear(self) -> None:
+        """Drop everything from the index"""
+        with self._lock:
+            self._years.clear()
+            self._names_by_key.clear()
+            self._words.clear()
+            self._sorted_keys.clear()
+            self._trigrams.clear()
+            self._key_trigrams.clear()
+            self._indexed_years.clear()
@@ -0,0 +1,30 @@
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+@pytest.fixture
+def nhtsa_response():
+    """
+    Factory for fake NHTSA HTTP responses
+
+    Builds a response listing the given model names, or serving a raw `body`.
+    The JSON is parsed from the body, as requests does, so the payload hash and
+    the parsed models always agree.
+    """
+    def build(models=(), status_code=200, headers=None, body=None):
+        if body is None:
+            body = json.dumps({"Results": [{"Model_Name": name} for name in models]}).encode()
+        response = Mock()
+        response.status_code = status_code
+        response.content = body
+        response.headers = headers or {}
+        response.json.side_effect = lambda: json.loads(body)
+        response.raise_for_status.return_value = None
+        return response
+    return build
+
+@pytest.fixture
+def mock_requests_get():
+    """Mock requests.get used by the NHTSA data source"""
+    with patch('app.services.data_sources.requests.get') as mock_get:
+        yield mock_get
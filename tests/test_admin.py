@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.compression import response_cache
+from app.services.honda_service import make_services
+
+client = TestClient(app)
+
+HEADERS = {"X-Admin-Key": "secret"}
+
+@pytest.fixture(autouse=True)
+def admin_key():
+    """Enable the admin API with a known key"""
+    with patch('app.routers.admin.settings.ADMIN_API_KEY', "secret"):
+        yield
+
+@pytest.fixture
+def mock_requests_get(mock_requests_get, nhtsa_response):
+    """Mock requests.get returning Accord and Civic for every year"""
+    mock_requests_get.return_value = nhtsa_response(["Accord", "Civic"])
+    return mock_requests_get
+
+@pytest.fixture
+def service(mock_requests_get):
+    """Honda service with 1995-1997 cached, purged again afterwards"""
+    service = make_services.get("honda")
+    service.purge_years()
+    service.get_all_models_in_range(1995, 1997)
+    yield service
+    service.purge_years()
+
+def test_admin_requires_key():
+    """Test authentication and the disabled state"""
+    assert client.get("/admin/cache").status_code == 401
+    assert client.get("/admin/cache", headers={"X-Admin-Key": "wrong"}).status_code == 401
+    with patch('app.routers.admin.settings.ADMIN_API_KEY', ""):
+        assert client.get("/admin/cache", headers=HEADERS).status_code == 503
+
+def test_cache_listing(service):
+    """Test that cached years are listed with size, age and hits"""
+    service.get_models_for_year(1995)
+    
+    data = client.get("/admin/cache?make=Honda", headers=HEADERS).json()
+    
+    assert [info["make"] for info in data["makes"]] == ["honda"]
+    honda = data["makes"][0]
+    assert [entry["year"] for entry in honda["entries"]] == [1995, 1996, 1997]
+    assert honda["entries"][0]["hits"] >= 1
+    assert honda["entries"][0]["model_count"] == 2
+    assert honda["size_bytes"] == sum(entry["size_bytes"] for entry in honda["entries"]) > 0
+    assert honda["index_bytes"] > 0
+    assert data["total_bytes"] >= honda["size_bytes"] + honda["index_bytes"] + data["sorted_models_bytes"]
+
+def test_purge_cascades(service):
+    """Test that purging drops years from the cache, search index and response cache"""
+    response_cache.get_or_compress(b"x" * 1000, "gzip")
+    
+    data = client.post("/admin/cache/purge?make=honda&start_year=1990&end_year=1996", headers=HEADERS).json()
+    
+    assert data == {"make": "honda", "purged_years": [1995, 1996], "response_cache_cleared": True}
+    assert service.cache.years() == [1997]
+    assert service.search_models("accord")[0]["years"] == [1997]
+    assert response_cache.stats()["entries"] == 0
+
+def test_purge_requires_both_years():
+    """Test that a half-open purge range is rejected"""
+    response = client.post("/admin/cache/purge?start_year=2020", headers=HEADERS)
+    assert response.status_code == 400
+
+def test_purge_rejects_out_of_range_years():
+    """Test that purge years are bounded like every other year parameter"""
+    response = client.post("/admin/cache/purge?start_year=0&end_year=1000000000", headers=HEADERS)
+    assert response.status_code == 422
+
+def test_refresh(service, mock_requests_get):
+    """Test that a forced refresh revalidates every year in the range"""
+    calls = mock_requests_get.call_count
+    
+    data = client.post("/admin/cache/refresh?make=honda&start_year=1996&end_year=1998", headers=HEADERS).json()
+    
+    assert mock_requests_get.call_count == calls + 3
+    assert data["results"] == [
+        {"year": 1996, "model_count": 2, "changed": False},
+        {"year": 1997, "model_count": 2, "changed": False},
+        {"year": 1998, "model_count": 2, "changed": True}
+    ]
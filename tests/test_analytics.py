@@ -0,0 +1,26 @@
+import random
+import pytest
+from app.services.analytics import compute_discontinued, compute_statistics, compute_statistics_sweep
+
+@pytest.fixture
+def yearly_models():
+    """Random but reproducible yearly model data"""
+    rng = random.Random(42)
+    names = [f"Model {number}" for number in range(60)]
+    return {year: frozenset(rng.sample(names, rng.randint(1, 30))) for year in range(2000, 2021)}
+
+def test_compute_discontinued():
+    """Test discontinuation from already-fetched data"""
+    yearly_models = {2018: {"Accord", "CR-Z"}, 2019: {"Accord", "CR-Z"}, 2020: {"Accord"}, 2021: {"Accord"}}
+    result = compute_discontinued(yearly_models, 2018, 2021)
+    assert result["discontinued_models"] == {"CR-Z"}
+
+@pytest.mark.parametrize("window", [1, 2, 3, 5, 11])
+def test_sweep_matches_per_window_statistics(yearly_models, window):
+    """Test that the incremental sweep equals computing each window separately"""
+    sweep = compute_statistics_sweep(yearly_models, 2000, 2020, window)
+    expected = [
+        compute_statistics(yearly_models, start_year, start_year + window - 1)
+        for start_year in range(2000, 2020 - window + 2)
+    ]
+    assert sweep == expected
@@ -0,0 +1,108 @@
+import asyncio
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.changes import ModelChangeBroker, ModelRefresher, format_sse
+from app.services.data_sources import ModelDataSource
+from app.services.honda_service import MakeServiceRegistry
+
+class FakeSource(ModelDataSource):
+    """In-memory data source whose data tests can change"""
+    name = "fake"
+
+    def __init__(self, data):
+        self.data = data
+
+    def fetch_models(self, make, year):
+        return set(self.data.get((make, year), ()))
+
+def test_refresh_pushes_changes_to_subscribers():
+    """Test that a background refresh delivers added and removed models"""
+    async def scenario():
+        source = FakeSource({
+            ("honda", 2025): {"Accord", "Civic"},
+            ("honda", 2026): {"Accord"},
+            ("acura", 2025): {"MDX"}
+        })
+        services = MakeServiceRegistry(source=source)
+        broker = ModelChangeBroker(queue_size=10)
+        services.add_change_listener(broker.publish)
+
+        subscription = broker.subscribe("honda", frozenset({2025}))
+        other_year = broker.subscribe("honda", frozenset({2026}))
+        other_make = broker.subscribe("acura", frozenset({2025}))
+        services.get("honda").get_models_for_year(2025)
+        services.get("honda").get_models_for_year(2026)
+        services.get("acura").get_models_for_year(2025)
+
+        source.data[("honda", 2025)] = {"Accord", "Prologue"}
+        await ModelRefresher(services, broker, interval=60).refresh_once()
+
+        event = await asyncio.wait_for(subscription.queue.get(), timeout=1)
+        return event, other_year.queue.qsize() + other_make.queue.qsize(), broker.subscribed_years()
+
+    event, other_pending, subscribed = asyncio.run(scenario())
+
+    assert event["make"] == "honda"
+    assert event["year"] == 2025
+    assert event["added"] == ["Prologue"]
+    assert event["removed"] == ["Civic"]
+    assert other_pending == 0
+    assert subscribed == {"honda": {2025, 2026}, "acura": {2025}}
+
+def test_unchanged_refresh_sends_nothing():
+    """Test that refreshing identical data does not notify subscribers"""
+    async def scenario():
+        services = MakeServiceRegistry(source=FakeSource({("honda", 2025): {"Accord"}}))
+        broker = ModelChangeBroker(queue_size=10)
+        services.add_change_listener(broker.publish)
+        subscription = broker.subscribe("honda", frozenset({2025}))
+        services.get("honda").get_models_for_year(2025)
+
+        await ModelRefresher(services, broker, interval=60).refresh_once()
+        await asyncio.sleep(0)
+        return subscription.queue.qsize()
+
+    assert asyncio.run(scenario()) == 0
+
+def test_changes_after_purge_reach_subscribers():
+    """Test that a year refetched after a purge is diffed against the last published models"""
+    async def scenario():
+        source = FakeSource({("honda", 2025): {"Accord", "Civic"}})
+        services = MakeServiceRegistry(source=source)
+        broker = ModelChangeBroker(queue_size=10)
+        services.add_change_listener(broker.publish)
+        service = services.get("honda")
+        subscription = broker.subscribe("honda", frozenset({2025}), {2025: service.get_models_for_year(2025)})
+
+        service.purge_years([2025])
+        source.data[("honda", 2025)] = {"Accord"}
+        await ModelRefresher(services, broker, interval=60).refresh_once()
+        return await asyncio.wait_for(subscription.queue.get(), timeout=1)
+
+    event = asyncio.run(scenario())
+    assert event["added"] == []
+    assert event["removed"] == ["Civic"]
+
+def test_failing_listener_does_not_break_fetch():
+    """Test that a listener error is logged and the remaining listeners still run"""
+    def broken(make, year, models):
+        raise RuntimeError("boom")
+
+    services = MakeServiceRegistry(source=FakeSource({("honda", 2025): {"Accord"}}))
+    received = []
+    services.add_change_listener(broken)
+    services.add_change_listener(lambda make, year, models: received.append((make, year, models)))
+
+    assert services.get("honda").get_models_for_year(2025) == {"Accord"}
+    assert received == [("honda", 2025, frozenset({"Accord"}))]
+
+def test_format_sse():
+    """Test Server-Sent Events message formatting"""
+    assert format_sse("subscribed", {"years": [2025]}) == 'event: subscribed\ndata: {"years": [2025]}\n\n'
+
+def test_subscribe_rejects_too_many_years():
+    """Test subscription year validation"""
+    client = TestClient(app)
+    query = "&".join(f"years={year}" for year in range(2000, 2020))
+    response = client.get(f"/models/subscribe?{query}")
+    assert response.status_code == 400
@@ -0,0 +1,95 @@
+import argparse
+import json
+import pytest
+from unittest.mock import patch
+from app.cli import build_report, main, parse_make, parse_window
+
+@pytest.fixture
+def mock_requests_get(mock_requests_get, nhtsa_response):
+    """Mock requests.get with Accord everywhere and CR-Z until 2018"""
+    def side_effect(*args, **kwargs):
+        url = args[0]
+        year = int(url.split("/modelyear/")[1].split("?")[0])
+        return nhtsa_response(["Accord", "CR-Z"] if year <= 2018 else ["Accord"])
+
+    mock_requests_get.side_effect = side_effect
+    return mock_requests_get
+
+def test_parse_window_invalid():
+    """Test rejecting malformed and reversed windows"""
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_window("2020")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_window("2022-2020")
+
+def test_parse_make():
+    """Test that --make is normalized and validated like the HTTP routes"""
+    assert parse_make("Honda") == "honda"
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_make("bad/make")
+    with patch('app.services.honda_service.settings.ALLOWED_MAKES', ["honda"]):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_make("toyota")
+
+def test_span_shorter_than_window_length():
+    """Test that a span too short for the window length is a usage error, not the default windows"""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["report", "--span", "2020-2025"])
+    assert exc_info.value.code == 2
+
+def test_report_fetches_each_year_once(tmp_path, mock_requests_get):
+    """Test that overlapping windows share a single fetch per year"""
+    output = tmp_path / "report.md"
+    exit_code = main([
+        "report", "--window", "2015-2020", "--window", "2016-2021",
+        "--output", str(output)
+    ])
+
+    assert exit_code == 0
+    assert mock_requests_get.call_count == 7
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert [window["statistics"]["analysis_period"] for window in report["windows"]] == ["2015-2020", "2016-2021"]
+    assert report["windows"][0]["discontinued"]["discontinued_models"] == ["CR-Z"]
+    assert "CR-Z" in output.read_text()
+
+def test_report_offline_from_input(tmp_path, mock_requests_get):
+    """Test generating sliding windows from previously saved JSON without network"""
+    source = tmp_path / "source.json"
+    source.write_text(json.dumps({
+        "yearly_models": {str(year): ["Accord", "Civic"] for year in range(2010, 2016)}
+    }))
+
+    exit_code = main([
+        "report", "--input", str(source), "--offline",
+        "--span", "2010-2015", "--window-length", "4",
+        "--output", str(tmp_path / "out.md"), "--json", str(tmp_path / "out.json")
+    ])
+
+    assert exit_code == 0
+    assert mock_requests_get.call_count == 0
+    report = json.loads((tmp_path / "out.json").read_text())
+    assert len(report["windows"]) == 3
+    assert report["windows"][-1]["statistics"]["analysis_period"] == "2012-2015"
+
+def test_build_report_sweep_matches_per_window_statistics():
+    """Test that sliding windows computed in one pass match windows computed one at a time"""
+    yearly_models = {year: {"Accord", "CR-Z"} if year <= 2013 else {"Accord", "Civic"} for year in range(2010, 2018)}
+    windows = [(start_year, start_year + 3) for start_year in range(2010, 2015)]
+
+    swept = build_report("honda", yearly_models, windows, sweep=(2010, 2017, 4))
+    single = build_report("honda", yearly_models, windows)
+
+    assert swept["windows"] == single["windows"]
+
+def test_report_offline_missing_years(tmp_path):
+    """Test that offline mode fails when input data does not cover the windows"""
+    source = tmp_path / "source.json"
+    source.write_text(json.dumps({"yearly_models": {"2020": ["Accord"]}}))
+
+    exit_code = main([
+        "report", "--input", str(source), "--offline", "--window", "2020-2023",
+        "--output", str(tmp_path / "out.md")
+    ])
+
+    assert exit_code == 1
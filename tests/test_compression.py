@@ -0,0 +1,66 @@
+import gzip
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.compression import CompressedBodyCache, CompressionMiddleware, select_encoding
+
+PAYLOAD = {"models": ["Accord", "Civic", "CR-V", "Pilot"] * 100}
+
+@pytest.fixture
+def cache():
+    """Create an empty compressed body cache"""
+    return CompressedBodyCache(max_bytes=1024 * 1024)
+
+@pytest.fixture
+def client(cache):
+    """Create a test client for a small app behind the compression middleware"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, cache=cache)
+
+    @app.get("/large")
+    async def large():
+        return PAYLOAD
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+def test_select_encoding():
+    """Test Accept-Encoding negotiation"""
+    assert select_encoding("gzip, deflate, br") == "br"
+    assert select_encoding("gzip") == "gzip"
+    assert select_encoding("br;q=0, gzip;q=0.5") == "gzip"
+    assert select_encoding("identity") is None
+    assert select_encoding("") is None
+
+def test_large_response_compressed_once(client, cache):
+    """Test that repeat responses reuse the cached compressed body"""
+    for _ in range(3):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == PAYLOAD
+
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+
+def test_small_response_not_compressed(client, cache):
+    """Test that responses below the size threshold pass through"""
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert cache.stats()["entries"] == 0
+
+def test_cache_evicts_to_byte_limit():
+    """Test LRU eviction once the byte budget is exceeded"""
+    cache = CompressedBodyCache(max_bytes=200)
+    bodies = [bytes(str(i) * 400, "ascii") for i in range(10)]
+    for body in bodies:
+        assert gzip.decompress(cache.get_or_compress(body, "gzip")) == body
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 200
+    assert stats["entries"] < len(bodies)
@@ -0,0 +1,164 @@
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from app.cli import main
+from app.services.data_sources import NHTSAHttpSource, VPICLocalSource, Validators, content_hash, create_data_source
+from app.services.honda_service import HondaModelsService
+
+CSV_DUMP = """Make_Name,Model_Name,Model_Year
+HONDA,Accord,2020
+HONDA,Civic,2020
+HONDA,CR-Z,2016
+TOYOTA,Camry,2020
+"""
+
+@pytest.fixture
+def local_source(tmp_path):
+    """Create a local vPIC store imported from a small CSV export"""
+    dump = tmp_path / "vpic.csv"
+    dump.write_text(CSV_DUMP)
+    source = VPICLocalSource(str(tmp_path / "vpic.sqlite3"))
+    source.import_dump(str(dump))
+    return source
+
+def test_local_source_answers_without_network(local_source):
+    """Test that the local store answers by make and year with no HTTP calls"""
+    with patch('app.services.data_sources.requests.get') as mock_get:
+        service = HondaModelsService(source=local_source)
+        assert service.get_models_for_year(2020) == {"Accord", "Civic"}
+        assert service.get_models_for_year(2016) == {"CR-Z"}
+        assert service.get_models_for_year(1999) == set()
+    assert mock_get.call_count == 0
+
+def test_local_source_json_formats(tmp_path):
+    """Test importing API-style JSON and gzip-compressed JSON lines"""
+    api_json = tmp_path / "vpic.json"
+    api_json.write_text(json.dumps({"Results": [{"Make_Name": "Honda", "Model_Name": "Pilot", "Model_Year": "2021"}]}))
+    jsonl = tmp_path / "vpic.jsonl.gz"
+    with gzip.open(jsonl, "wt") as handle:
+        handle.write(json.dumps({"make": "honda", "model": "Passport", "year": 2021}) + "\n")
+
+    source = VPICLocalSource(str(tmp_path / "vpic.sqlite3"))
+    source.import_dump(str(api_json))
+    source.import_dump(str(jsonl), replace=False)
+
+    assert source.fetch_models("honda", 2021) == {"Pilot", "Passport"}
+
+def test_local_source_empty_store(tmp_path):
+    """Test that an empty store without a dump reports unavailable"""
+    source = VPICLocalSource(str(tmp_path / "vpic.sqlite3"))
+    with pytest.raises(HTTPException) as exc_info:
+        source.fetch_models("honda", 2020)
+    assert exc_info.value.status_code == 503
+
+def test_local_source_imports_dump_lazily(tmp_path):
+    """Test that a configured dump is imported on first use"""
+    dump = tmp_path / "vpic.csv"
+    dump.write_text(CSV_DUMP)
+    source = VPICLocalSource(str(tmp_path / "vpic.sqlite3"), dump_path=str(dump))
+    assert source.fetch_models("toyota", 2020) == {"Camry"}
+
+def test_local_source_concurrent_first_use_imports_once(tmp_path):
+    """Test that parallel first lookups import the dump a single time"""
+    dump = tmp_path / "vpic.csv"
+    dump.write_text(CSV_DUMP)
+    source = VPICLocalSource(str(tmp_path / "vpic.sqlite3"), dump_path=str(dump))
+    service = HondaModelsService(source=source)
+
+    with patch.object(source, '_import', wraps=source._import) as mock_import:
+        yearly_models = service.get_all_models_in_range(2014, 2021)
+
+    assert mock_import.call_count == 1
+    assert yearly_models[2020] == {"Accord", "Civic"}
+
+def test_create_data_source():
+    """Test selecting data sources by name"""
+    assert isinstance(create_data_source("nhtsa"), NHTSAHttpSource)
+    assert isinstance(create_data_source("vpic_local"), VPICLocalSource)
+    with pytest.raises(ValueError):
+        create_data_source("unknown")
+
+def test_cli_import_vpic(tmp_path):
+    """Test the import-vpic command"""
+    dump = tmp_path / "vpic.csv"
+    dump.write_text(CSV_DUMP)
+    db = tmp_path / "store.sqlite3"
+
+    assert main(["import-vpic", str(dump), "--db", str(db)]) == 0
+    assert VPICLocalSource(str(db)).fetch_models("honda", 2020) == {"Accord", "Civic"}
+
+def test_nhtsa_conditional_request_not_modified(mock_requests_get, nhtsa_response):
+    """Test that validators are sent and a 304 is reported as unchanged"""
+    source = NHTSAHttpSource("https://example.test", 5)
+    previous = Validators("abc", etag='"v1"', last_modified="Mon, 01 Sep 2025 00:00:00 GMT")
+
+    mock_requests_get.return_value = nhtsa_response(status_code=304, body=b"")
+    result = source.fetch_models_if_changed("honda", 2020, previous)
+
+    assert mock_requests_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Sep 2025 00:00:00 GMT"
+    }
+    assert result.models is None
+    assert result.validators == previous
+
+def test_nhtsa_identical_body_is_not_parsed(mock_requests_get, nhtsa_response):
+    """Test that a byte-identical 200 response skips JSON parsing"""
+    source = NHTSAHttpSource("https://example.test", 5)
+
+    mock_requests_get.return_value = nhtsa_response(["Accord"], headers={"ETag": '"v2"'})
+    first = source.fetch_models_if_changed("honda", 2020)
+    assert first.models == {"Accord"}
+    assert first.validators == Validators(content_hash(mock_requests_get.return_value.content), etag='"v2"')
+
+    unchanged = mock_requests_get.return_value = nhtsa_response(["Accord"])
+    second = source.fetch_models_if_changed("honda", 2020, first.validators)
+    assert second.models is None
+    unchanged.json.assert_not_called()
+
+def test_service_refresh_skips_unchanged_payload(mock_requests_get, nhtsa_response):
+    """Test that refreshing an unchanged year leaves the cache entry, index and listeners alone"""
+    service = HondaModelsService(source=NHTSAHttpSource("https://example.test", 5))
+    changes = []
+    service.add_change_listener(lambda make, year, models: changes.append((year, models)))
+
+    mock_requests_get.return_value = nhtsa_response(["Accord"])
+    first = service.get_models_for_year(2025)
+    with patch.object(service.index, 'update_year') as update_year:
+        assert service.refresh_year(2025) is first
+    update_year.assert_not_called()
+    assert changes == [(2025, frozenset({"Accord"}))]
+
+    mock_requests_get.return_value = nhtsa_response(["Accord", "Prologue"])
+    service.refresh_year(2025)
+    assert changes[1:] == [(2025, frozenset({"Accord", "Prologue"}))]
+    assert service.search_models("prologue")[0]["years"] == [2025]
+
+def test_nhtsa_caps_concurrent_requests(mock_requests_get, nhtsa_response):
+    """Test that requests through one source never exceed max_concurrency in flight"""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    source = NHTSAHttpSource("https://example.test", 5, max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def slow_get(*args, **kwargs):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        return nhtsa_response(["Accord"])
+
+    mock_requests_get.side_effect = slow_get
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda year: source.fetch_models("honda", year), range(2000, 2016)))
+
+    assert mock_requests_get.call_count == 16
+    assert max(peak) == 2
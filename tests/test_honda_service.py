@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import Mock, patch
 from app.services.honda_service import HondaModelsService
@@ -10,7 +11,7 @@ def honda_service():
 @pytest.fixture
 def mock_requests_get():
     """Mock requests.get for testing"""
-    with patch('app.services.honda_service.requests.get') as mock_get:
+    with patch('app.services.data_sources.requests.get') as mock_get:
         yield mock_get
 
 def test_get_models_for_year_success(honda_service, mock_requests_get):
@@ -25,6 +26,7 @@ def test_get_models_for_year_success(honda_service, mock_requests_get):
         ]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_get.return_value = mock_response
     
     # Test
@@ -42,6 +44,7 @@ def test_get_models_for_year_empty_response(honda_service, mock_requests_get):
     mock_response = Mock()
     mock_response.json.return_value = {"Results": []}
     mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_get.return_value = mock_response
     
     # Test
@@ -66,6 +69,7 @@ def test_get_all_models_in_range(honda_service, mock_requests_get):
         else:
             mock_response.json.return_value = {"Results": []}
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
     
     # Configure mock to return different responses based on URL
@@ -117,6 +121,7 @@ def test_find_discontinued_models(honda_service, mock_requests_get):
             mock_response.json.return_value = {"Results": []}
         
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
     
     mock_requests_get.side_effect = side_effect
@@ -137,6 +142,7 @@ def test_comprehensive_statistics(honda_service, mock_requests_get):
         "Results": [{"Model_Name": "Accord"}, {"Model_Name": "Civic"}]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_get.return_value = mock_response
     
     # Test
@@ -158,6 +164,7 @@ def test_api_connectivity_test(honda_service, mock_requests_get):
         "Results": [{"Model_Name": "Accord"}, {"Model_Name": "Civic"}]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_requests_get.return_value = mock_response
     
     # Test
@@ -167,3 +174,116 @@ def test_api_connectivity_test(honda_service, mock_requests_get):
     assert result["status"] == "healthy"
     assert result["api_connectivity"] == "ok"
     assert "test_query_result" in result
+
+def test_get_models_for_year_cached(honda_service, mock_requests_get):
+    """Test that repeat lookups are served from the cache and indexed"""
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "Accord"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_requests_get.return_value = mock_response
+    
+    # Test
+    first = honda_service.get_models_for_year(2020)
+    second = honda_service.get_models_for_year(2020)
+    
+    # Assertions
+    assert first == second == {"Accord"}
+    assert mock_requests_get.call_count == 1
+    assert honda_service.search_models("acc")[0]["years"] == [2020]
+
+def test_get_model_years_warm_cache(honda_service, mock_requests_get):
+    """Test that model timelines come from the index once every year is cached"""
+    def side_effect(*args, **kwargs):
+        url = args[0]
+        mock_response = Mock()
+        results = [{"Model_Name": "Accord"}]
+        if "/modelyear/2011?" in url or "/modelyear/2012?" in url:
+            results.append({"Model_Name": "CR-Z"})
+        mock_response.json.return_value = {"Results": results}
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        return mock_response
+    
+    mock_requests_get.side_effect = side_effect
+    
+    # Test
+    result = honda_service.get_model_years("cr-z")
+    calls_after_warmup = mock_requests_get.call_count
+    again = honda_service.get_model_years("CR-Z")
+    
+    # Assertions
+    assert result == {"name": "CR-Z", "years": [2011, 2012]}
+    assert again == result
+    assert mock_requests_get.call_count == calls_after_warmup
+    assert honda_service.get_model_years("Insight") is None
+
+def test_cache_evicts_least_recently_used_year(mock_requests_get):
+    """Test the per-make year quota evicts from both the cache and the index"""
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "Accord"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_requests_get.return_value = mock_response
+    
+    with patch('app.services.honda_service.settings.CACHE_MAX_YEARS_PER_MAKE', 2):
+        service = HondaModelsService()
+    service.get_models_for_year(2018)
+    service.get_models_for_year(2019)
+    service.get_models_for_year(2018)
+    service.get_models_for_year(2020)
+    
+    assert service.cache.years() == [2018, 2020]
+    assert service.search_models("accord")[0]["years"] == [2018, 2020]
+
+def test_concurrent_stores_keep_index_in_sync():
+    """Test that concurrent stores and evictions leave the index matching the cache"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with patch('app.services.honda_service.settings.CACHE_MAX_YEARS_PER_MAKE', 2):
+        service = HondaModelsService()
+    years = [2000 + (i % 8) for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda year: service._store_models(year, frozenset({"Accord"})), years))
+    
+    assert service.search_models("accord")[0]["years"] == sorted(service.cache.years())
+
+def test_cache_clear_drops_index(honda_service, mock_requests_get):
+    """Test that clearing the cache also clears the search index"""
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "Accord"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_requests_get.return_value = mock_response
+    
+    honda_service.get_models_for_year(2020)
+    honda_service.cache.clear()
+    
+    assert honda_service.cache.years() == []
+    assert honda_service.search_models("accord") == []
+
+def test_year_quota_must_cover_year_range():
+    """Test that a per-make quota too small to hold every year is rejected at startup"""
+    from pydantic import ValidationError
+    from app.core.config import Settings
+    
+    with pytest.raises(ValidationError):
+        Settings(CACHE_MAX_YEARS_PER_MAKE=20)
+    assert Settings(CACHE_MAX_YEARS_PER_MAKE=0).CACHE_MAX_YEARS_PER_MAKE == 0
+
+def test_make_service_registry_partitions():
+    """Test that each make gets its own service and the default make is never evicted"""
+    from app.services.honda_service import MakeServiceRegistry
+    
+    registry = MakeServiceRegistry(source=Mock())
+    with patch('app.services.honda_service.settings.MAX_CACHED_MAKES', 2):
+        honda = registry.get("Honda")
+        acura = registry.get("acura")
+        assert registry.get("HONDA") is honda
+        assert honda.cache is not acura.cache
+        
+        registry.get("toyota")
+        assert sorted(service.make for service in registry.services()) == ["honda", "toyota"]
+    
+    with pytest.raises(ValueError):
+        registry.get("not/a make")
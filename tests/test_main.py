@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -84,3 +85,191 @@ def test_nonexistent_endpoint():
     """Test accessing a nonexistent endpoint"""
     response = client.get("/nonexistent")
     assert response.status_code == 404
+
+def test_search_models_from_cache():
+    """Test searching model names seen in cached years"""
+    from unittest.mock import Mock, patch
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "CR-V"}, {"Model_Name": "Civic"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    with patch('app.services.data_sources.requests.get', return_value=mock_response):
+        assert client.get("/models/1995").status_code == 200
+
+    response = client.get("/models/search?q=crv")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["results"][0]["name"] == "CR-V"
+    assert 1995 in data["results"][0]["years"]
+
+def test_search_models_requires_query():
+    """Test that an empty search query is rejected"""
+    response = client.get("/models/search?q=")
+    assert response.status_code == 422
+
+def test_get_model_years():
+    """Test the per-model timeline endpoint"""
+    from unittest.mock import Mock, patch
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "Accord"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    with patch('app.services.data_sources.requests.get', return_value=mock_response):
+        response = client.get("/models/by-name/accord/years")
+        missing = client.get("/models/by-name/Nonexistent/years")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Accord"
+    assert data["total_years"] == len(data["years"])
+    assert missing.status_code == 404
+
+def test_get_statistics_sweep():
+    """Test sliding-window statistics, including the process pool path"""
+    from unittest.mock import Mock, patch
+    from app.core.config import settings
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": "Accord"}, {"Model_Name": "Civic"}]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    with patch('app.services.data_sources.requests.get', return_value=mock_response):
+        inline = client.get("/models/statistics/sweep?start_year=1990&end_year=2000&window=5")
+        with patch.object(settings, "SWEEP_PROCESS_POOL_THRESHOLD", 0):
+            pooled = client.get("/models/statistics/sweep?start_year=1990&end_year=2000&window=5")
+
+    assert inline.status_code == 200
+    data = inline.json()
+    assert data["total_windows"] == 7
+    assert data["windows"][0]["analysis_period"] == "1990-1994"
+    assert data["windows"][-1]["analysis_period"] == "1996-2000"
+    assert pooled.json() == data
+
+def test_get_statistics_sweep_invalid_window():
+    """Test that a window longer than the span is rejected"""
+    response = client.get("/models/statistics/sweep?start_year=2020&end_year=2022&window=5")
+    assert response.status_code == 400
+
+def test_get_models_range_projection_and_pagination():
+    """Test fields projection and cursor pagination on the range endpoint"""
+    from unittest.mock import Mock, patch
+    from app.services.honda_service import honda_service
+
+    honda_service.cache.clear()
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": name} for name in ("Accord", "Civic", "Pilot")]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    with patch('app.services.data_sources.requests.get', return_value=mock_response):
+        base = "/models/range?start_year=1991&end_year=1993"
+        full = client.get(base).json()
+        counts = client.get(base + "&fields=counts").json()
+        summary = client.get(base + "&fields=summary").json()
+        counts_page = client.get(base + "&fields=counts&limit=2").json()
+
+        pages = []
+        url = base + "&fields=names&limit=2"
+        while True:
+            page = client.get(url).json()
+            pages.append(page)
+            if "next_cursor" not in page:
+                break
+            url = base + "&fields=names&limit=2&cursor=" + page["next_cursor"]
+
+    assert full["total_unique_models"] == 3
+    assert "next_cursor" not in full and "yearly_counts" not in full
+    assert counts == {"start_year": 1991, "end_year": 1993, "yearly_counts": {"1991": 3, "1992": 3, "1993": 3}}
+    assert summary == {"start_year": 1991, "end_year": 1993, "total_unique_models": 3}
+    assert counts_page["yearly_counts"] == {"1991": 3, "1992": 3}
+    assert "next_cursor" in counts_page
+
+    assert len(pages) == 5
+    assert all("total_unique_models" not in page for page in pages)
+    merged = {}
+    for page in pages:
+        for year, names in page["yearly_data"].items():
+            merged.setdefault(year, []).extend(names)
+    assert merged == full["yearly_data"]
+
+def test_get_models_range_names_page_fetches_only_needed_years():
+    """Test that a paged names request stops fetching once the page is full"""
+    from unittest.mock import Mock, patch
+    from app.services.honda_service import honda_service
+
+    honda_service.cache.clear()
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"Results": [{"Model_Name": name} for name in ("Accord", "Civic", "Pilot")]}
+    mock_response.raise_for_status.return_value = None
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    with patch('app.services.data_sources.requests.get', return_value=mock_response) as mock_get:
+        page = client.get("/models/range?start_year=1991&end_year=1995&fields=names&limit=2").json()
+
+    assert page["yearly_data"] == {"1991": ["Accord", "Civic"]}
+    assert mock_get.call_count == 1
+
+def test_get_models_range_invalid_cursor():
+    """Test that malformed cursors are rejected"""
+    response = client.get("/models/range?start_year=2020&end_year=2022&cursor=not-a-cursor")
+    assert response.status_code == 400
+
+def test_fleet_counts_and_discontinued():
+    """Test fleet endpoints fetch each make separately and report per-make results"""
+    from unittest.mock import Mock, patch
+    from app.services.honda_service import make_services
+    
+    for make in ("honda", "acura"):
+        make_services.get(make).cache.clear()
+    
+    models_by_make = {
+        "honda": {2017: ["Accord", "Civic", "Fit"], 2018: ["Accord", "Civic", "Fit"], 2019: ["Accord", "Civic"], 2020: ["Accord", "Civic"]},
+        "acura": {2017: ["ILX", "RLX"], 2018: ["ILX", "RLX"], 2019: ["ILX"], 2020: ["ILX"]}
+    }
+    
+    def fake_get(url, **kwargs):
+        make = url.split("/make/")[1].split("/")[0]
+        year = int(url.split("/modelyear/")[1].split("?")[0])
+        if make == "broken":
+            raise ConnectionError("upstream down")
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "Results": [{"Model_Name": name} for name in models_by_make[make].get(year, [])]
+        }
+        mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        return mock_response
+    
+    with patch('app.services.data_sources.requests.get', side_effect=fake_get):
+        counts = client.get("/fleet/counts?start_year=2018&end_year=2020&makes=honda&makes=Acura").json()
+        discontinued = client.get("/fleet/discontinued?start_year=2017&end_year=2020&makes=honda&makes=acura").json()
+        partial = client.get("/fleet/counts?start_year=2018&end_year=2020&makes=acura&makes=broken").json()
+    
+    assert [entry["make"] for entry in counts["makes"]] == ["honda", "acura"]
+    assert counts["fleet_yearly_counts"] == {"2018": 5, "2019": 3, "2020": 3}
+    assert counts["fleet_unique_models"] == 5
+    assert {entry["make"]: entry["discontinued_models"] for entry in discontinued["makes"]} == {
+        "honda": ["Fit"], "acura": ["RLX"]
+    }
+    assert discontinued["total_discontinued"] == 2
+    assert partial["makes"][0]["total_unique_models"] == 2
+    assert "error" in partial["makes"][1] and "yearly_counts" not in partial["makes"][1]
+
+def test_fleet_counts_invalid_make():
+    """Test that malformed makes are rejected"""
+    response = client.get("/fleet/counts?start_year=2018&end_year=2020&makes=bad/make")
+    assert response.status_code == 400
+
+def test_fleet_too_many_makes_creates_no_partitions():
+    """Test that a rejected fleet request leaves the make registry untouched"""
+    from app.core.config import settings
+    from app.services.honda_service import make_services
+    
+    before = [service.make for service in make_services.services()]
+    query = "&".join(f"makes=junk{i}" for i in range(settings.MAX_FLEET_MAKES + 1))
+    response = client.get(f"/fleet/counts?start_year=2018&end_year=2020&{query}")
+    
+    assert response.status_code == 400
+    assert [service.make for service in make_services.services()] == before
@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import patch
+from app.services.model_index import ModelIndex
+
+@pytest.fixture
+def index():
+    """Create an index seeded with a few years of models"""
+    index = ModelIndex()
+    index.update_year(2015, {"Accord", "Civic", "CR-V", "CR-Z", "FourTrax Rancher"})
+    index.update_year(2016, {"Accord", "Civic", "CR-V", "CR-Z"})
+    index.update_year(2017, {"Accord", "Civic", "CR-V", "Clarity"})
+    return index
+
+def test_prefix_search_with_years(index):
+    """Test prefix matches return names with sorted years"""
+    results = index.search("cr")
+    names = [result["name"] for result in results]
+    assert names == ["CR-V", "CR-Z"]
+    assert results[1]["years"] == [2015, 2016]
+
+def test_punctuation_and_case_insensitive(index):
+    """Test that "crv" finds "CR-V" as an exact match"""
+    results = index.search("crv")
+    assert results[0]["name"] == "CR-V"
+    assert results[0]["score"] == 100.0
+
+def test_ranking_prefers_prefix_over_substring(index):
+    """Test relevance ordering between match types"""
+    results = index.search("c")
+    assert results[0]["name"] in ("CR-V", "CR-Z")
+    assert "FourTrax Rancher" not in [result["name"] for result in results]
+
+    results = index.search("ranch")
+    assert results[0]["name"] == "FourTrax Rancher"
+
+def test_fuzzy_match(index):
+    """Test near-miss spellings still match via trigrams"""
+    results = index.search("acord")
+    assert results[0]["name"] == "Accord"
+
+def test_incremental_update_removes_dropped_models(index):
+    """Test that replacing a year drops models no longer sold that year"""
+    index.update_year(2017, {"Accord", "Civic", "CR-V"}, previous={"Accord", "Civic", "CR-V", "Clarity"})
+    assert index.search("clarity") == []
+    assert index.search("cr-v")[0]["years"] == [2015, 2016, 2017]
+
+def test_lookup_scores_only_candidates():
+    """Test lookups score only names sharing a trigram or prefix, not the whole index"""
+    families = ["Accord", "Civic", "CR", "CB", "CBR", "CRF", "TRX", "FourTrax", "Pioneer", "Gold Wing"]
+    index = ModelIndex()
+    for year in range(1990, 2031):
+        index.update_year(year, {f"{family} {number}" for family in families for number in range(30)})
+
+    with patch.object(index, '_score', wraps=index._score) as score:
+        results = index.search("pioneer 2")
+
+    assert results[0]["name"] == "Pioneer 2"
+    assert score.call_count <= 40
+    assert index.stats()["models"] == 300
+
+def test_years_for_exact_and_normalized(index):
+    """Test inverted index lookups by exact and loosely spelled names"""
+    assert index.years_for("CR-Z") == ("CR-Z", [2015, 2016])
+    assert index.years_for("crz") == ("CR-Z", [2015, 2016])
+    assert index.years_for("Insight") is None
+
+def test_remove_year(index):
+    """Test that evicting a year drops names only sold in that year"""
+    index.remove_year(2015, {"Accord", "Civic", "CR-V", "CR-Z", "FourTrax Rancher"})
+    assert index.search("fourtrax") == []
+    assert index.years_for("CR-Z") == ("CR-Z", [2016])
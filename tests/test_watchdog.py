@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import time
+from fastapi.testclient import TestClient
+from app.core.watchdog import LoopWatchdog
+from app.main import app
+
+def blocking_call():
+    """Stand-in for synchronous I/O inside an async route"""
+    time.sleep(0.3)
+
+def test_watchdog_reports_blocking_call(caplog):
+    """Test that a blocked loop is counted and its stack is logged"""
+    async def scenario():
+        watchdog = LoopWatchdog(interval=0.02, block_threshold=0.1)
+        await watchdog.start()
+        await asyncio.sleep(0.05)
+        blocking_call()
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+        return watchdog
+
+    with caplog.at_level(logging.WARNING, logger="app.core.watchdog"):
+        watchdog = asyncio.run(scenario())
+
+    metrics = watchdog.metrics()
+    assert metrics["event_loop_stalls_total"] == 1
+    assert metrics["event_loop_lag_max_seconds"] >= 0.2
+    assert "blocking_call" in caplog.text
+
+def test_watchdog_catches_block_between_intervals():
+    """Test a block longer than the threshold but shorter than the interval is still counted"""
+    async def scenario():
+        watchdog = LoopWatchdog(interval=0.5, block_threshold=0.2)
+        await watchdog.start()
+        await asyncio.sleep(0.01)
+        time.sleep(0.35)
+        await asyncio.sleep(0.15)
+        await watchdog.stop()
+        return watchdog
+
+    metrics = asyncio.run(scenario()).metrics()
+    assert metrics["event_loop_stalls_total"] == 1
+    assert metrics["event_loop_lag_max_seconds"] > 0.2
+
+def test_metrics_endpoint():
+    """Test the Prometheus metrics endpoint"""
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "# TYPE event_loop_lag_seconds summary" in response.text
+    assert "event_loop_lag_seconds_count " in response.text
+    assert "# TYPE event_loop_stalls_total counter" in response.text